@@ -4,7 +4,8 @@
 
 # Built-in packages
 import argparse
-from typing import Optional
+import asyncio
+from typing import List, Optional
 import html
 import time
 import urllib.parse
@@ -14,6 +15,7 @@ import re
 
 # Third-party packages
 from fastapi import (
+	Body,
 	FastAPI,
 	Header,
 	Path,
@@ -23,7 +25,6 @@ from fastapi import (
 	status
 )
 from fastapi.responses import (
-	JSONResponse,
 	StreamingResponse,
 	RedirectResponse,
 	FileResponse
@@ -35,18 +36,37 @@ import pyrogram
 import uvicorn
 
 # Configuration
-from config.feeds import rss, opds
+from config.feeds import opds, opds2, opensearch, rss
 from config.limits import limits
 from config.metadata import openapi
 from config.pyrogram import config
-from config.urls import urls
 from config.resolvers import resolvers
 from config.headers import headers
+from config.cache import cache
+from config.exports import exports as exports_config
+from config.batch import batch
+from config.downloads import downloads
 
 # Utils
 from utils.streaming import stream_from_response
-from utils.books import create_caption
-from utils.paginations import create_pagination
+from utils.books import BooksFacets, BooksFormatting, BooksIndex
+from utils.paginations import create_page, paginate
+from utils.serialization import Fragments, JSON_FORMAT
+from utils.responses import FastJSONResponse
+from utils.negotiation import FormatNegotiationMiddleware, response_format
+from utils.conditional import ConditionalRequestMiddleware, create_etag
+from utils.compression import AVAILABLE_ENCODINGS, CompressionMiddleware, negotiate_encoding
+from utils.caching import CacheControlMiddleware, ResponseCache, ResponseCacheMiddleware
+from utils.exports import stream_ndjson, Snapshot
+from utils.ranges import parse_range, if_range_matches, iter_file, iter_open_file, slice_chunks
+from utils.changelog import Changelog
+from utils.batch import Subrequest, execute_batch
+from utils.media import create_media_headers, create_media_metadata
+from utils.feeds import OPDSEntries, RSSItems, create_opds_feed, create_opds_facets, create_feed_response
+from utils.events import BooksEvents
+from utils.searches import Searches
+from utils.downloads import DownloadsCache
+from utils.opds2 import create_opds2_publications, create_opds2_navigation, create_opds2_links, create_opds2_feed
 
 app = FastAPI(
 	title="PlmcBksAPI",
@@ -56,7 +76,7 @@ app = FastAPI(
 	openapi_tags=openapi.TAGS,
 	docs_url="/",
 	redoc_url=None,
-	default_response_class=JSONResponse
+	default_response_class=FastJSONResponse
 )
 
 books_list = list(plmcbks.books)
@@ -70,12 +90,178 @@ years_list = list(plmcbks.years)
 covers_list = list(plmcbks.covers)
 documents_list = list(plmcbks.documents)
 
+# Representações JSON pré-serializadas de cada objeto do acervo
+books_fragments = Fragments(books_list, max_projections=limits.MAX_PROJECTIONS)
+categories_fragments = Fragments(categories_list, max_projections=limits.MAX_PROJECTIONS)
+authors_fragments = Fragments(authors_list, max_projections=limits.MAX_PROJECTIONS)
+artists_fragments = Fragments(artists_list, max_projections=limits.MAX_PROJECTIONS)
+narrators_fragments = Fragments(narrators_list, max_projections=limits.MAX_PROJECTIONS)
+publishers_fragments = Fragments(publishers_list, max_projections=limits.MAX_PROJECTIONS)
+types_fragments = Fragments(types_list, max_projections=limits.MAX_PROJECTIONS)
+years_fragments = Fragments(years_list, max_projections=limits.MAX_PROJECTIONS)
+covers_fragments = Fragments(covers_list, max_projections=limits.MAX_PROJECTIONS)
+documents_fragments = Fragments(documents_list, max_projections=limits.MAX_PROJECTIONS)
+
+books_ids = [book.id for book in books_list]
+categories_ids = [category.id for category in categories_list]
+authors_ids = [author.id for author in authors_list]
+artists_ids = [artist.id for artist in artists_list]
+narrators_ids = [narrator.id for narrator in narrators_list]
+publishers_ids = [publisher.id for publisher in publishers_list]
+types_ids = [type.id for type in types_list]
+years_ids = [year.id for year in years_list]
+covers_ids = [cover.id for cover in covers_list]
+documents_ids = [document.id for document in documents_list]
+
+# Livros em ordem decrescente (adicionados recentemente primeiro)
+recent_books_ids = books_ids[::-1]
+
+# Coleções disponíveis para exportação, com as identificações em ordem crescente
+exports = {
+	"books": (books_fragments, sorted(books_ids)),
+	"documents": (documents_fragments, sorted(documents_ids)),
+	"covers": (covers_fragments, sorted(covers_ids)),
+	"categories": (categories_fragments, sorted(categories_ids)),
+	"authors": (authors_fragments, sorted(authors_ids)),
+	"artists": (artists_fragments, sorted(artists_ids)),
+	"narrators": (narrators_fragments, sorted(narrators_ids)),
+	"publishers": (publishers_fragments, sorted(publishers_ids)),
+	"types": (types_fragments, sorted(types_ids)),
+	"years": (years_fragments, sorted(years_ids))
+}
+
+# Livros relacionados a cada entidade
+categories_index = BooksIndex(plmcbks.books)
+authors_index = BooksIndex(plmcbks.books)
+artists_index = BooksIndex(plmcbks.books)
+narrators_index = BooksIndex(plmcbks.books)
+publishers_index = BooksIndex(plmcbks.books)
+types_index = BooksIndex(plmcbks.books)
+years_index = BooksIndex(plmcbks.books)
+
+# Facetas (tipo, ano e categoria) dos feeds OPDS. As contagens do acervo completo
+# são calculadas durante o carregamento.
+books_facets = BooksFacets(books_list, opds.FACET_GROUPS, cache.MAX_FACET_ENTRIES)
+books_facets.get("books", books_ids, (None, None, None))
+books_facets.get("books", books_ids, (None, None, None), reverse=True)
+
+# Textos já formatados (legendas e datas) dos livros
+books_formatting = BooksFormatting(books_list)
+
+# Entradas dos livros nos feeds OPDS
+opds_entries = OPDSEntries(plmcbks.books, books_formatting)
+
+# Publicações e links de navegação dos feeds OPDS 2.0
+opds2_publications = create_opds2_publications(books_list, books_formatting)
+opds2_navigations = {
+	"authors": create_opds2_navigation(authors_list, "authors"),
+	"artists": create_opds2_navigation(artists_list, "artists"),
+	"narrators": create_opds2_navigation(narrators_list, "narrators"),
+	"publishers": create_opds2_navigation(publishers_list, "publishers"),
+	"categories": create_opds2_navigation(categories_list, "categories"),
+	"types": create_opds2_navigation(types_list, "types"),
+	"years": create_opds2_navigation(years_list, "years")
+}
+
+# Itens do feed RSS
+rss_items = RSSItems(
+	books=plmcbks.books,
+	formatting=books_formatting,
+	max_items=limits.MAX_FEED_ITEMS,
+	buckets=limits.RSS_BUCKETS,
+	encodings=AVAILABLE_ENCODINGS,
+	max_size=cache.MAX_RSS_SIZE
+)
+
+# Documento de descrição OpenSearch, gerado uma única vez
+opensearch_description = opensearch.DESCRIPTION.encode("utf-8")
+
+# Resultados das pesquisas feitas recentemente
+searches = Searches(cache.MAX_SEARCHES)
+
+# Notificações dos livros adicionados ao acervo
+books_events = BooksEvents(books_fragments, books_ids)
+
+# Coleções com feeds RSS próprios para cada entidade
+rss_collections = {
+	"authors": (plmcbks.authors, authors_index),
+	"artists": (plmcbks.artists, artists_index),
+	"narrators": (plmcbks.narrators, narrators_index),
+	"publishers": (plmcbks.publishers, publishers_index),
+	"categories": (plmcbks.categories, categories_index),
+	"types": (plmcbks.types, types_index),
+	"years": (plmcbks.years, years_index)
+}
+
 pclient = None
 
 rate_limit = None
 last_modified = time.strftime(
 	"%a, %d %b %Y %H:%M:%S GMT", time.localtime(LAST_MODIFIED))
 
+# Versão do acervo. Todo conteúdo servido pela API depende apenas dela.
+catalog_version = str(LAST_MODIFIED)
+etag_version = f"{catalog_version}:{app.version}"
+
+rss_items.update(catalog_version, books_list)
+
+# Respostas já geradas (e comprimidas) pela API
+response_cache = ResponseCache(
+	version=catalog_version,
+	max_size=cache.MAX_SIZE,
+	max_entry_size=cache.MAX_ENTRY_SIZE
+)
+
+app.add_middleware(CompressionMiddleware)
+
+app.add_middleware(
+	ResponseCacheMiddleware,
+	cache=response_cache,
+	excluded_paths=cache.EXCLUDED_PATHS
+)
+
+app.add_middleware(FormatNegotiationMiddleware)
+
+# O cabeçalho Cache-Control é adicionado aqui (e não pelo servidor), de modo que
+# cada resposta possua apenas um, e faz parte dos cabeçalhos das respostas 304.
+app.add_middleware(
+	CacheControlMiddleware,
+	cache_control=headers.CACHE_CONTROL,
+	excluded_cache_control=headers.UNVERSIONED_CACHE_CONTROL,
+	excluded_paths=cache.UNVERSIONED_PATHS
+)
+
+# As respostas 304 guardam os mesmos cabeçalhos (incluindo o Vary) das respostas
+# completas, de modo que este deve ser o último middleware a alterá-las.
+app.add_middleware(
+	ConditionalRequestMiddleware,
+	version=etag_version,
+	last_modified=last_modified,
+	excluded_paths=cache.UNVERSIONED_PATHS,
+	max_entries=cache.MAX_VALIDATORS
+)
+
+# Cópia completa do acervo, gerada em segundo plano
+snapshot = Snapshot(
+	directory=exports_config.SNAPSHOTS_DIRECTORY,
+	version=catalog_version,
+	collections=exports,
+	chunk_size=limits.EXPORT_CHUNK_ITEMS
+)
+
+# Histórico de alterações do acervo
+changelog = Changelog(
+	directory=exports_config.CHANGELOG_DIRECTORY,
+	max_versions=exports_config.MAX_CHANGELOG_VERSIONS
+)
+
+# Documentos já baixados do Telegram
+downloads_cache = DownloadsCache(
+	directory=downloads.DOWNLOADS_DIRECTORY,
+	max_size=downloads.MAX_SIZE,
+	max_file_size=downloads.MAX_FILE_SIZE
+)
+
 clients_ok = False
 
 # https://stackoverflow.com/a/8391735
@@ -84,38 +270,32 @@ sys.stdout = open(file=os.devnull, mode="w")
 @app.get("/books", tags=["interações"])
 def get_books(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(books_list, max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, books_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/books/{book_id}", tags=["interações"])
@@ -131,53 +311,49 @@ def get_book_by_id(
 	if book is None:
 		content = {"error": "book not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return dict(book)
+	return FastJSONResponse(content=books_fragments.get(book_id, response_format.get()))
 
 
 @app.get("/categories", tags=["interações"])
 def get_categories(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todas as categorias disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(categories_list, max_items)
+	fragments = categories_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, categories_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/categories/{category_id}", tags=["interações"])
 def get_books_by_category(
 	category_id: int = Path(..., title="Identificação numérica da categoria", description="Identificação da categoria.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará todos os livros presentes na categoria em questão.
@@ -188,79 +364,67 @@ def get_books_by_category(
 	if category is None:
 		content = {"error": "category not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = category.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = categories_index.get(category)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/authors", tags=["interações"])
 def get_authors(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os autores disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(authors_list, max_items)
+	fragments = authors_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, authors_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/authors/{author_id}", tags=["interações"])
 def get_books_by_author(
 	author_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros escritos pelo autor em questão.
@@ -271,79 +435,67 @@ def get_books_by_author(
 	if author is None:
 		content = {"error": "author not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = author.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = authors_index.get(author)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/artists", tags=["interações"])
 def get_artists(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os artistas disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(artists_list, max_items)
+	fragments = artists_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, artists_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/artists/{artist_id}", tags=["interações"])
 def get_books_by_artist(
 	artist_id: int = Path(..., title="Identificação numérica do artista", description="Identificação do artista.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros ilustrados pelo artista em questão.
@@ -354,79 +506,67 @@ def get_books_by_artist(
 	if artist is None:
 		content = {"error": "artist not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = artist.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = artists_index.get(artist)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/narrators", tags=["interações"])
 def get_narrators(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os narradores disponíveis
 	"""
 	
-	objects_pagination = create_pagination(narrators_list, max_items)
+	fragments = narrators_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, narrators_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/narrators/{narrator_id}", tags=["interações"])
 def get_books_by_narrator(
 	narrator_id: int = Path(..., title="Identificação numérica do narrador", description="Identificação da narrador.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros narrados pelo narrador em questão.
@@ -437,79 +577,67 @@ def get_books_by_narrator(
 	if narrator is None:
 		content = {"error": "narrator not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = narrator.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = narrators_index.get(narrator)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/publishers", tags=["interações"])
 def get_publishers(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todas as editoras disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(publishers_list, max_items)
+	fragments = publishers_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, publishers_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/publishers/{publisher_id}", tags=["interações"])
 def get_books_by_publisher(
 	publisher_id: int = Path(..., title="Identificação numérica da editora", description="Identificação da editora.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros publicados pela editora em questão.
@@ -520,79 +648,67 @@ def get_books_by_publisher(
 	if publisher is None:
 		content = {"error": "publisher not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = publisher.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = publishers_index.get(publisher)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/types", tags=["interações"])
 def get_types(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os tipos disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(types_list, max_items)
+	fragments = types_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, types_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/types/{type_id}", tags=["interações"])
 def get_books_by_type(
 	type_id: int = Path(..., title="Identificação numérica do tipo", description="Identificação do tipo.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros do tipo em questão.
@@ -603,79 +719,67 @@ def get_books_by_type(
 	if type is None:
 		content = {"error": "type not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = type.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = types_index.get(type)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/years", tags=["interações"])
 def get_years(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os anos de publicação disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(years_list, max_items)
+	fragments = years_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, years_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/years/{year_id}", tags=["interações"])
 def get_books_by_year(
 	year_id: int = Path(..., title="Identificação numérica do ano", description="Identificação do ano.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros publicados no ano em questão.
@@ -686,35 +790,27 @@ def get_books_by_year(
 	if year is None:
 		content = {"error": "year not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = year.get_books(plmcbks.books)
-	objects_pagination = create_pagination(list(books), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects_ids = years_index.get(year)
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/books", tags=["buscas"])
@@ -722,48 +818,39 @@ def search_books(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por livros.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.books.fast_search(query_name)
-	else:
-		results = plmcbks.books.slow_search(query_name)
+	objects_ids = searches.get("books", plmcbks.books, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no books found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = books_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/authors", tags=["buscas"])
@@ -771,48 +858,39 @@ def search_authors(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por autores.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.authors.fast_search(query_name)
-	else:
-		results = plmcbks.authors.slow_search(query_name)
+	objects_ids = searches.get("authors", plmcbks.authors, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no authors found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = authors_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/artists", tags=["buscas"])
@@ -820,48 +898,39 @@ def search_artists(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por artistas.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.artists.fast_search(query_name)
-	else:
-		results = plmcbks.artists.slow_search(query_name)
+	objects_ids = searches.get("artists", plmcbks.artists, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no artists found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = artists_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/narrators", tags=["buscas"])
@@ -869,48 +938,39 @@ def search_narrators(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por narradores.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.narrators.fast_search(query_name)
-	else:
-		results = plmcbks.narrators.slow_search(query_name)
+	objects_ids = searches.get("narrators", plmcbks.narrators, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no narrators found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = narrators_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/publishers", tags=["buscas"])
@@ -918,48 +978,39 @@ def search_publishers(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por editoras.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.publishers.fast_search(query_name)
-	else:
-		results = plmcbks.publishers.slow_search(query_name)
+	objects_ids = searches.get("publishers", plmcbks.publishers, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no publishers found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = publishers_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/categories", tags=["buscas"])
@@ -967,48 +1018,39 @@ def search_categories(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por categorias.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.categories.fast_search(query_name)
-	else:
-		results = plmcbks.categories.slow_search(query_name)
+	objects_ids = searches.get("categories", plmcbks.categories, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no categories found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = categories_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/types", tags=["buscas"])
@@ -1016,48 +1058,39 @@ def search_types(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por tipos.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.types.fast_search(query_name)
-	else:
-		results = plmcbks.types.slow_search(query_name)
+	objects_ids = searches.get("types", plmcbks.types, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no types found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = types_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/search/years", tags=["buscas"])
@@ -1065,85 +1098,70 @@ def search_years(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por anos.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.years.fast_search(query_name)
-	else:
-		results = plmcbks.years.slow_search(query_name)
+	objects_ids = searches.get("years", plmcbks.years, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no years found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(list(results), max_items)
+	fragments = years_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/documents", tags=["mídias"])
 def get_documents(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os documentos disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(documents_list, max_items)
+	fragments = documents_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, documents_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/documents/{document_id}", tags=["mídias"])
@@ -1159,21 +1177,77 @@ def get_document_by_id(
 	if document is None:
 		content = {"error": "document not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return dict(document)
+	return FastJSONResponse(content=documents_fragments.get(document_id, response_format.get()))
 
 
 @app.get("/download/{document_id}", tags=["mídias"])
 async def download_document_by_id(
-	document_id: int = Path(..., title="Identificação numérica dd documento", description="Identificação do documento.", ge=limits.MIN_ID, le=limits.MAX_ID)
+	document_id: int = Path(..., title="Identificação numérica dd documento", description="Identificação do documento.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	meta: Optional[bool] = Query(False, title="Apenas informações", description="Retorna apenas as informações do documento (tamanho, tipo, data e nome do arquivo), sem o conteúdo"),
+	range_header: Optional[str] = Header(None, alias="Range"),
+	if_range: Optional[str] = Header(None, alias="If-Range")
 ):
 	"""
-	Use este método para baixar o documento em questão.
+	Use este método para baixar o documento em questão. Downloads parciais (cabeçalho Range) são suportados.
 	"""
 	
 	global rate_limit
 	
+	document = plmcbks.documents.get(document_id)
+	
+	if document is None:
+		content = {"error": "document not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	book = document.get_book(plmcbks.books)
+	
+	if meta:
+		content = create_media_metadata(document, book, "document")
+		return FastJSONResponse(content=content)
+	
+	headers = create_media_headers(document, book, "attachment", "document")
+	headers["ETag"] = create_etag(etag_version, f"/download/{document_id}", "")
+	
+	size = document.file_size
+	byte_range = None
+	
+	if if_range_matches(if_range, headers["ETag"], headers["Last-Modified"]):
+		byte_range = parse_range(range_header, size)
+	
+	if byte_range is False:
+		content = {"error": "requested range is not satisfiable"}
+		headers = {"Content-Range": f"bytes */{size}"}
+		status_code = status.HTTP_416_RANGE_NOT_SATISFIABLE
+		return FastJSONResponse(
+			content=content, status_code=status_code, headers=headers)
+	
+	if byte_range is not None:
+		(start, end) = byte_range
+		
+		headers.update({
+			"Content-Range": f"bytes {start}-{end}/{size}",
+			"Content-Length": str(end - start + 1)
+		})
+	
+	# Documentos já guardados em disco são enviados sem acessar o Telegram.
+	cache_key = f"{document.id}-{document.message_id}"
+	
+	file = downloads_cache.open(cache_key)
+	
+	if file is not None:
+		if byte_range is None:
+			return StreamingResponse(
+				content=iter_open_file(file, 0, size - 1), headers=headers)
+		
+		return StreamingResponse(
+			content=iter_open_file(file, start, end),
+			status_code=status.HTTP_206_PARTIAL_CONTENT,
+			headers=headers
+		)
+	
 	if not clients_ok:
 		await build_clients()
 	
@@ -1183,28 +1257,11 @@ async def download_document_by_id(
 			content = {"error": f"too many requests, retry after {remaining_seconds} seconds"}
 			headers = {"Retry-After": str(remaining_seconds)}
 			status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-			return JSONResponse(
+			return FastJSONResponse(
 				content=content, status_code=status_code, headers=headers)
 		else:
 			rate_limit = None
 	
-	document = plmcbks.documents.get(document_id)
-	book = document.get_book(plmcbks.books)
-	
-	if document is None:
-		content = {"error": "document not found"}
-		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
-	
-	headers = {
-		"Last-Modified": time.strftime(
-			"%a, %d %b %Y %H:%M:%S GMT", time.localtime(document.date)),
-		"Content-Type": document.mime_type,
-		"Content-Length": str(document.file_size),
-		"Content-Disposition": 'attachment; filename="{}"'.format(
-			urllib.parse.quote(f"{book.title}.{document.file_extension}" if book.title is not None else f"cover.{cover.file_extension}")),
-	}
-	
 	try:
 		message = await pclient.get_messages(
 			chat_id=-1001436494509, message_ids=document.message_id)
@@ -1214,49 +1271,81 @@ async def download_document_by_id(
 		content = {"error": "we don't have enough resources to serve this file at this moment"}
 		headers = {"Retry-After": str(e.x)}
 		status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-		return JSONResponse(
+		return FastJSONResponse(
 			content=content, status_code=status_code, headers=headers)
-	else:
-		content = await pclient.stream_media(message)
 	
-	return StreamingResponse(content=content, headers=headers)
+	if byte_range is None:
+		content = downloads_cache.store(
+			cache_key, await pclient.stream_media(message), size)
+		
+		return StreamingResponse(content=content, headers=headers)
+	
+	# Apenas as partes que contêm o intervalo solicitado são baixadas (e o
+	# documento não é guardado).
+	offset = start // downloads.TELEGRAM_CHUNK_SIZE
+	limit = end // downloads.TELEGRAM_CHUNK_SIZE - offset + 1
+	
+	content = slice_chunks(
+		await pclient.stream_media(message, limit=limit, offset=offset),
+		start - offset * downloads.TELEGRAM_CHUNK_SIZE,
+		end - start + 1
+	)
+	
+	return StreamingResponse(
+		content=content,
+		status_code=status.HTTP_206_PARTIAL_CONTENT,
+		headers=headers
+	)
+
+
+@app.head("/download/{document_id}", tags=["mídias"])
+def head_document_by_id(
+	document_id: int = Path(..., title="Identificação numérica dd documento", description="Identificação do documento.", ge=limits.MIN_ID, le=limits.MAX_ID)
+):
+	"""
+	Este método retornará apenas os cabeçalhos do download do documento em questão (tamanho, tipo, data e nome do arquivo), sem acessar o Telegram.
+	"""
+	
+	document = plmcbks.documents.get(document_id)
+	
+	if document is None:
+		return Response(status_code=status.HTTP_404_NOT_FOUND)
+	
+	book = document.get_book(plmcbks.books)
+	headers = create_media_headers(document, book, "attachment", "document")
+	
+	return Response(headers=headers)
 
 
 @app.get("/covers", tags=["mídias"])
 def get_covers(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(10, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todas as imagens de capa disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(covers_list, max_items)
+	fragments = covers_fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = create_page(fragments, covers_ids, page_number, max_items, cursor=cursor, version=catalog_version)
 	
-	data = {
-		"pagination": {
-			"total_pages": len(objects_pagination),
-			"remaining_pages": len(objects_pagination) - 1 - page_number,
-			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
-			"current_page": page_number,
-			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
-		},
-		"results": {
-			"total_results": sum(len(page) for page in objects_pagination),
-			"max_results": max_items,
-			"display_results": len(objects),
-			"items": objects
-		}
-	}
+	if content is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return data
+	return FastJSONResponse(content=content)
 
 
 @app.get("/covers/{cover_id}", tags=["mídias"])
@@ -1272,35 +1361,34 @@ def get_cover_by_id(
 	if cover is None:
 		content = {"error": "cover not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	return dict(cover)
+	return FastJSONResponse(content=covers_fragments.get(cover_id, response_format.get()))
 
 
 @app.get("/view/{cover_id}", tags=["mídias"])
 async def view_cover_by_id(
-	cover_id: int = Path(..., title="Identificação numérica da capa", description="Identificação da capa.", ge=limits.MIN_ID, le=limits.MAX_ID)
+	cover_id: int = Path(..., title="Identificação numérica da capa", description="Identificação da capa.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	meta: Optional[bool] = Query(False, title="Apenas informações", description="Retorna apenas as informações da capa (tamanho, tipo, data e nome do arquivo), sem o conteúdo")
 ):
 	"""
 	Use este método para visualizar a imagem de capa em questão.
 	"""
 	
 	cover = plmcbks.covers.get(cover_id)
-	book = cover.get_book(plmcbks.books)
 	
 	if cover is None:
 		content = {"error": "cover not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	headers = {
-		"Last-Modified": time.strftime(
-			"%a, %d %b %Y %H:%M:%S GMT", time.localtime(cover.date)),
-		"Content-Type": cover.mime_type,
-		"Content-Length": str(cover.file_size),
-		"Content-Disposition": 'inline; filename="{}"'.format(
-			urllib.parse.quote(f"{book.title}.{cover.file_extension}" if book.title is not None else f"cover.{cover.file_extension}")),
-	}
+	book = cover.get_book(plmcbks.books)
+	
+	if meta:
+		content = create_media_metadata(cover, book, "cover")
+		return FastJSONResponse(content=content)
+	
+	headers = create_media_headers(cover, book, "inline", "cover")
 	
 	filename = f"./images/covers/{cover.file_unique_id}.jpg"
 	
@@ -1309,141 +1397,373 @@ async def view_cover_by_id(
 	
 	content = {"error": "cover not found"}
 	status_code = status.HTTP_404_NOT_FOUND
-	return JSONResponse(content=content, status_code=status_code)
+	return FastJSONResponse(content=content, status_code=status_code)
 
 
-@app.get("/rss", tags=["rss"])
-def rss_feed(
-	max_items: Optional[int] = Query(50, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+@app.head("/view/{cover_id}", tags=["mídias"])
+def head_cover_by_id(
+	cover_id: int = Path(..., title="Identificação numérica da capa", description="Identificação da capa.", ge=limits.MIN_ID, le=limits.MAX_ID)
 ):
 	"""
-	Este método retornará um feed RSS contendo os livros adicionados recentemente.
+	Este método retornará apenas os cabeçalhos da imagem de capa em questão (tamanho, tipo, data e nome do arquivo), sem acessar o disco.
 	"""
 	
-	books = plmcbks.books.list()[-max_items:]
-	books.reverse()
-	
-	items = (
-		rss.ITEM_BASE.format(
-			html.escape(book.title) if book.title is not None else "Unknown",
-			urls.PRIVATE_CHAT_URL + '/' + str(book.message_id),
-			urls.PRIVATE_CHAT_URL + '/' + str(book.message_id),
-			urls.API_URL + "/download/" + str(book.documents[0].message_id), book.documents[0].file_size, book.documents[0].mime_type,
-			html.escape("plmcbks@pm.me (Polemic Books)"),
-			time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date)),
-			html.escape(
-				"<p>"
-				+ f'<img src="{urls.API_URL + "/view/" + str(book.cover.id)}" width="{book.cover.resolution.width}" height="{book.cover.resolution.height}" referrerpolicy="no-referrer">'
-				+ create_caption(book)
-				+ f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>'
-				"</p>"
-			)
-		) for book in books
-	)
+	cover = plmcbks.covers.get(cover_id)
+	
+	if cover is None:
+		return Response(status_code=status.HTTP_404_NOT_FOUND)
 	
-	content = rss.BASE.format("".join(items))
+	book = cover.get_book(plmcbks.books)
+	headers = create_media_headers(cover, book, "inline", "cover")
 	
-	return Response(content=content, media_type="application/rss+xml")
+	return Response(headers=headers)
 
 
-@app.get("/opds", tags=["opds"])
-def opds_home():
+@app.get("/export/snapshot", tags=["exportações"])
+async def export_snapshot(
+	range_header: Optional[str] = Header(None, alias="Range"),
+	if_range: Optional[str] = Header(None, alias="If-Range")
+):
 	"""
-	Este método retornará uma listagem com opções disponíveis para navegação.
+	Este método retornará uma cópia completa do acervo em um único arquivo comprimido (NDJSON). Downloads parciais (cabeçalho Range) são suportados.
 	"""
 	
-	entries = [
-		("Autores", "autores", "https://polemicbooks.github.io/images/authors.jpg", last_modified, "/opds/authors", "Listagem de autores"),
-		("Artistas", "artistas", "https://polemicbooks.github.io/images/artists.jpg", last_modified, "/opds/artists", "Listagem de artistas"),
-		("Narradores", "narradores", "https://polemicbooks.github.io/images/narrators.jpg", last_modified, "/opds/narrators", "Listagem de narradores"),
-		("Editoras", "editoras", "https://polemicbooks.github.io/images/publishers.jpg", last_modified, "/opds/publishers", "Listagem de editoras"),
-		("Categorias", "categorias", "https://polemicbooks.github.io/images/categories.jpg", last_modified, "/opds/categories", "Listagem de categorias"),
-		("Tipos", "tipos", "https://polemicbooks.github.io/images/types.jpg", last_modified, "/opds/types", "Listagem de tipos"),
-		("Anos", "anos", "https://polemicbooks.github.io/images/years.jpg", last_modified, "/opds/years", "Listagem de anos"),
-		("Recentes", "recentes", "https://polemicbooks.github.io/images/books.jpg", last_modified, "/opds/recent-books", "Livros recentes"),
-		("Antigos", "antigos", "https://polemicbooks.github.io/images/books.jpg", last_modified, "/opds/old-books", "Livros antigos")
-	]
+	if not snapshot.ready:
+		# Caso a geração anterior tenha falhado, ela é iniciada novamente.
+		snapshot.start(asyncio.get_event_loop())
+		
+		content = {"error": "snapshot is not available yet, retry later"}
+		headers = {"Retry-After": "60"}
+		status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+		return FastJSONResponse(
+			content=content, status_code=status_code, headers=headers)
 	
-	items = [
-		opds.ITEM_BASE.format(
-			title,
-			single_id,
-			image,
-			last_update,
-			endpoint,
-			text
-		) for (
-			title, single_id, image, last_update, endpoint, text
-		) in entries
-	]
+	size = os.path.getsize(snapshot.path)
+	etag = create_etag(etag_version, "/export/snapshot", "")
 	
-	content = opds.BASE.format(
-		"Polemic Books",
-		last_modified,
-		"https://polemicbooks.github.io/images/polemicbooks.jpg",
-		"Pesquise ou baixe ebooks, audiobooks, comics e mangás."
-	) + "".join(items) + "</feed>"
+	headers = {
+		"ETag": etag,
+		"Last-Modified": last_modified,
+		"Accept-Ranges": "bytes",
+		"Content-Disposition": f'attachment; filename="{snapshot.filename}"'
+	}
 	
-	return Response(content=content, media_type="application/atom+xml")
+	byte_range = None
+	
+	if if_range_matches(if_range, etag, last_modified):
+		byte_range = parse_range(range_header, size)
+	
+	if byte_range is False:
+		content = {"error": "requested range is not satisfiable"}
+		headers = {"Content-Range": f"bytes */{size}"}
+		status_code = status.HTTP_416_RANGE_NOT_SATISFIABLE
+		return FastJSONResponse(
+			content=content, status_code=status_code, headers=headers)
+	
+	# O arquivo é lido diretamente (e não pelo FileResponse, que interpretaria o
+	# cabeçalho Range novamente, inclusive os intervalos múltiplos ignorados acima).
+	if byte_range is None:
+		headers["Content-Length"] = str(size)
+		
+		return StreamingResponse(
+			content=iter_file(snapshot.path, 0, size - 1),
+			headers=headers,
+			media_type=snapshot.media_type
+		)
+	
+	(start, end) = byte_range
+	
+	headers.update({
+		"Content-Range": f"bytes {start}-{end}/{size}",
+		"Content-Length": str(end - start + 1)
+	})
+	
+	return StreamingResponse(
+		content=iter_file(snapshot.path, start, end),
+		status_code=status.HTTP_206_PARTIAL_CONTENT,
+		headers=headers,
+		media_type=snapshot.media_type
+	)
 
 
-@app.get("/opds/authors", tags=["opds"])
-def opds_get_authors(
-	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+@app.get("/export/{collection}", tags=["exportações"])
+def export_collection(
+	collection: str = Path(..., title="Coleção", description="Coleção a ser exportada.", regex="^(?:books|documents|covers|categories|authors|artists|narrators|publishers|types|years)$"),
+	after_id: Optional[int] = Query(None, title="Última identificação recebida", description="Retoma a exportação a partir do objeto seguinte a esta identificação.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	fields: Optional[str] = Query(None, title="Campos", description="Campos a serem retornados em cada item, separados por vírgula", max_length=limits.MAX_FIELDS_LENGTH)
 ):
 	"""
-	Este método retornará uma lista contendo todos os autores disponíveis.
+	Este método retornará todos os objetos da coleção em questão, no formato NDJSON (um objeto JSON por linha), em ordem crescente de identificação.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.authors.list(), max_items)
+	(fragments, objects_ids) = exports[collection]
+	
+	fragments = fragments.project(fields, response_format.get())
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if fragments is None:
+		content = {"error": "fields value is invalid"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	content = stream_ndjson(
+		fragments, objects_ids, after_id=after_id, chunk_size=limits.EXPORT_CHUNK_ITEMS)
 	
-	items = [
-		opds.ITEM_BASE.format(
-			html.escape(entity.name),
-			f"author:{entity.id}",
-			"https://polemicbooks.github.io/images/authors.jpg",
-			last_modified,
-			f"/opds/authors/{entity.id}",
-			html.escape(f"Possui {entity.total_books} livro(s)")
-		) for entity in objects
-	]
+	return StreamingResponse(content=content, media_type=fragments.format.sequence_media_type)
+
+
+@app.get("/changes", tags=["exportações"])
+def get_changes(
+	since: str = Query(..., title="Versão do acervo", description="Última versão do acervo sincronizada pelo cliente", max_length=limits.MAX_QUERY_LENGTH)
+):
+	"""
+	Este método retornará os objetos adicionados, alterados e removidos desde a versão do acervo em questão. Caso essa versão não esteja mais disponível no histórico, o cliente deverá sincronizar o acervo completo novamente.
+	"""
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	changes = changelog.get_changes(since)
 	
-	base_feed = opds.BASE.format(
-		f"Listagem de Autores ({page_number}/{total_pages})",
-		last_modified,
-		"https://polemicbooks.github.io/images/authors.jpg",
-		"Confira abaixo a lista de autores"
-	) + opds.SELF_BASE.format(
-			f"authors?page_number={page_number}"
+	if changes is None:
+		content = {"version": catalog_version, "since": since, "full_resync": True}
+		return FastJSONResponse(content=content)
+	
+	format = response_format.get()
+	collections = []
+	
+	for (name, collection) in changes.items():
+		fragments = exports[name][0].variant(format)
+		
+		collections.append(
+			format.dump(name) + format.colon + format.map_header(3)
+			+ format.dump("added") + format.colon
+			+ format.array_header(len(collection["added"]))
+			+ fragments.join(collection["added"])
+			+ format.array_footer + format.separator
+			+ format.dump("changed") + format.colon
+			+ format.array_header(len(collection["changed"]))
+			+ fragments.join(collection["changed"])
+			+ format.array_footer + format.separator
+			+ format.pair("removed", collection["removed"])
+			+ format.map_footer
 		)
 	
-	next_page = page_number + 1
+	content = (
+		format.map_header(4)
+		+ format.pair("version", catalog_version) + format.separator
+		+ format.pair("since", since) + format.separator
+		+ format.pair("full_resync", False) + format.separator
+		+ format.dump("changes") + format.colon + format.map_header(len(collections))
+		+ format.separator.join(collections)
+		+ format.map_footer
+		+ format.map_footer
+	)
+	
+	return FastJSONResponse(content=content)
+
+
+@app.get("/events", tags=["eventos"])
+async def get_events(
+	request: Request,
+	last_event_id: Optional[int] = Query(None, title="Último evento", description="Identificação do último livro recebido (alternativa ao cabeçalho Last-Event-ID)", ge=limits.MIN_ID, le=limits.MAX_ID)
+):
+	"""
+	Este método retornará um stream (Server-Sent Events) com os livros adicionados ao acervo. Ao reconectar, o cliente receberá os livros adicionados depois do último recebido (cabeçalho Last-Event-ID).
+	"""
+	
+	if books_events.is_full():
+		content = {"error": "too many connections"}
+		status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	header = request.headers.get("last-event-id")
+	
+	if header is not None and header.isdigit():
+		last_event_id = int(header)
+	
+	return StreamingResponse(
+		content=books_events.stream(last_event_id),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+	)
+
+
+@app.get("/rss", tags=["rss"])
+def rss_feed(
+	request: Request,
+	max_items: Optional[int] = Query(50, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+):
+	"""
+	Este método retornará um feed RSS contendo os livros adicionados recentemente.
+	"""
+	
+	feed = rss_items.get(max_items, negotiate_encoding(request.headers.get("accept-encoding")))
 	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/authors?page_number={next_page}"
+	if feed is not None:
+		(content, encoding) = feed
+		
+		return Response(
+			content=content,
+			media_type="application/rss+xml",
+			headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"} if encoding is not None else None
 		)
 	
-	content = base_feed + "".join(items) + "</feed>"
+	content = rss_items.iter(max_items)
+	
+	return create_feed_response(content, rss_items.count(max_items), "application/rss+xml")
+
+
+@app.get("/rss/{collection}/{entity_id}", tags=["rss"])
+def rss_entity_feed(
+	request: Request,
+	collection: str = Path(..., title="Coleção", description="Coleção da entidade (authors, artists, narrators, publishers, categories, types ou years)", regex="^(?:authors|artists|narrators|publishers|categories|types|years)$"),
+	entity_id: int = Path(..., title="Identificação numérica da entidade", description="Identificação da entidade.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	max_items: Optional[int] = Query(50, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+):
+	"""
+	Este método retornará um feed RSS contendo os livros adicionados recentemente relacionados à entidade em questão.
+	"""
+	
+	(entities, index) = rss_collections[collection]
+	
+	entity = entities.get(entity_id)
+	
+	if entity is None:
+		content = {"error": "entity not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	title = html.escape(f"Polemic Books: {entity.name}")
+	description = html.escape(rss.ENTITY_DESCRIPTIONS[collection].format(entity.name))
+	href = f"/rss/{collection}/{entity_id}"
+	books_ids = index.get(entity)
+	
+	feed = rss_items.get_feed(
+		(collection, entity_id),
+		title,
+		description,
+		href,
+		books_ids,
+		max_items,
+		negotiate_encoding(request.headers.get("accept-encoding"))
+	)
+	
+	# Apenas os feeds com as quantidades de itens mais usadas são guardados.
+	if feed is None:
+		content = rss_items.iter_feed(title, description, href, books_ids, max_items)
+		return create_feed_response(content, min(max_items, len(books_ids)), "application/rss+xml")
+	
+	(content, encoding) = feed
+	
+	return Response(
+		content=content,
+		media_type="application/rss+xml",
+		headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"} if encoding is not None else None
+	)
+
+
+@app.get("/opds", tags=["opds"])
+def opds_home():
+	"""
+	Este método retornará uma listagem com opções disponíveis para navegação.
+	"""
+	
+	entries = [
+		("Autores", "autores", "https://polemicbooks.github.io/images/authors.jpg", last_modified, "/opds/authors", "Listagem de autores"),
+		("Artistas", "artistas", "https://polemicbooks.github.io/images/artists.jpg", last_modified, "/opds/artists", "Listagem de artistas"),
+		("Narradores", "narradores", "https://polemicbooks.github.io/images/narrators.jpg", last_modified, "/opds/narrators", "Listagem de narradores"),
+		("Editoras", "editoras", "https://polemicbooks.github.io/images/publishers.jpg", last_modified, "/opds/publishers", "Listagem de editoras"),
+		("Categorias", "categorias", "https://polemicbooks.github.io/images/categories.jpg", last_modified, "/opds/categories", "Listagem de categorias"),
+		("Tipos", "tipos", "https://polemicbooks.github.io/images/types.jpg", last_modified, "/opds/types", "Listagem de tipos"),
+		("Anos", "anos", "https://polemicbooks.github.io/images/years.jpg", last_modified, "/opds/years", "Listagem de anos"),
+		("Recentes", "recentes", "https://polemicbooks.github.io/images/books.jpg", last_modified, "/opds/recent-books", "Livros recentes"),
+		("Antigos", "antigos", "https://polemicbooks.github.io/images/books.jpg", last_modified, "/opds/old-books", "Livros antigos")
+	]
+	
+	items = [
+		opds.ITEM_BASE.format(
+			title,
+			single_id,
+			image,
+			last_update,
+			endpoint,
+			text
+		) for (
+			title, single_id, image, last_update, endpoint, text
+		) in entries
+	]
+	
+	content = opds.BASE.format(
+		"Polemic Books",
+		last_modified,
+		"https://polemicbooks.github.io/images/polemicbooks.jpg",
+		"Pesquise ou baixe ebooks, audiobooks, comics e mangás."
+	) + "".join(items) + "</feed>"
 	
 	return Response(content=content, media_type="application/atom+xml")
 
 
+@app.get("/opds/authors", tags=["opds"])
+def opds_get_authors(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista contendo todos os autores disponíveis.
+	"""
+	
+	page = paginate(authors_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	objects = [plmcbks.authors.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
+	
+	items = [
+		opds.ITEM_BASE.format(
+			html.escape(entity.name),
+			f"author:{entity.id}",
+			"https://polemicbooks.github.io/images/authors.jpg",
+			last_modified,
+			f"/opds/authors/{entity.id}",
+			html.escape(f"Possui {entity.total_books} livro(s)")
+		) for entity in objects
+	]
+	
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/authors?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
+		f"Listagem de Autores ({page_number}/{total_pages})",
+		last_modified,
+		"https://polemicbooks.github.io/images/authors.jpg",
+		"Confira abaixo a lista de autores",
+		f"authors?page_number={page_number}",
+		next_href,
+		items
+	)
+	
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
+
+
 @app.get("/opds/authors/{author_id}", tags=["opds"])
 def opds_get_books_by_author(
 	author_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros escritos pelo autor em questão.
@@ -1454,86 +1774,84 @@ def opds_get_books_by_author(
 	if author is None:
 		content = {"error": "author not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = author.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get(("authors", author_id), authors_index.get(author), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/authors/{author_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/authors/{author_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/authors/{author_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/authors/{author_id}", {"sort": "recent"}, sort == "recent")
+		],
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros de {author.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/authors.jpg",
-		html.escape(f"Livros escritos por {author.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/authors/{author_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			"/opds/authors/{author_id}?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros escritos por {author.name}"),
+		html.escape(f"/opds/authors/{author_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/artists", tags=["opds"])
 def opds_get_artists(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os artistas disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.artists.list(), max_items)
+	page = paginate(artists_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.artists.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -1546,34 +1864,36 @@ def opds_get_artists(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
 	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/artists?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Artistas ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/artists.jpg",
-		"Confira abaixo a lista de artistas"
-	) + opds.SELF_BASE.format(
-			f"artists?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/artists?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de artistas",
+		f"artists?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/artists/{artist_id}", tags=["opds"])
 def opds_get_books_by_artist(
 	artist_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros ilustrados pelo artista em questão.
@@ -1584,86 +1904,84 @@ def opds_get_books_by_artist(
 	if artist is None:
 		content = {"error": "artist not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = artist.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get(("artists", artist_id), artists_index.get(artist), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/artists/{artist_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/artists/{artist_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/artists/{artist_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/artists/{artist_id}", {"sort": "recent"}, sort == "recent")
+		],
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros de {artist.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/artists.jpg",
-		html.escape(f"Livros ilustrados por {artist.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/artists/{artist_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/artists/{artist_id}?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros ilustrados por {artist.name}"),
+		html.escape(f"/opds/artists/{artist_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/narrators", tags=["opds"])
 def opds_get_narrators(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os narradores disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.narrators.list(), max_items)
+	page = paginate(narrators_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.narrators.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -1676,34 +1994,36 @@ def opds_get_narrators(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
 	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/narrators?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Narradores ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/narrators.jpg",
-		"Confira abaixo a lista de narradores"
-	) + opds.SELF_BASE.format(
-			f"narrators?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/narrators?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de narradores",
+		f"narrators?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/narrators/{narrator_id}", tags=["opds"])
 def opds_get_books_by_narrator(
 	narrator_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros narrados pelo narrador em questão.
@@ -1714,86 +2034,84 @@ def opds_get_books_by_narrator(
 	if narrator is None:
 		content = {"error": "narrator not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = narrator.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get(("narrators", narrator_id), narrators_index.get(narrator), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/narrators/{narrator_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/narrators/{narrator_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/narrators/{narrator_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/narrators/{narrator_id}", {"sort": "recent"}, sort == "recent")
+		],
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros de {narrator.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/narrators.jpg",
-		html.escape(f"Livros narrados por {narrator.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/narrators/{narrator_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/narrators/{narrator_id}?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros narrados por {narrator.name}"),
+		html.escape(f"/opds/narrators/{narrator_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/publishers", tags=["opds"])
 def opds_get_publishers(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todas as editoras disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.publishers.list(), max_items)
+	page = paginate(publishers_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.publishers.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -1806,34 +2124,36 @@ def opds_get_publishers(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
 	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/publishers?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Editoras ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/publishers.jpg",
-		"Confira abaixo a lista de editoras"
-	) + opds.SELF_BASE.format(
-			f"/opds/publishers?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/publishers?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de editoras",
+		f"/opds/publishers?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/publishers/{publisher_id}", tags=["opds"])
 def opds_get_books_by_publisher(
 	publisher_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros publicados pela editora editora em questão.
@@ -1844,86 +2164,84 @@ def opds_get_books_by_publisher(
 	if publisher is None:
 		content = {"error": "publisher not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = publisher.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get(("publishers", publisher_id), publishers_index.get(publisher), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/publishers/{publisher_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/publishers/{publisher_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/publishers/{publisher_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/publishers/{publisher_id}", {"sort": "recent"}, sort == "recent")
+		],
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros de {publisher.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/publishers.jpg",
-		html.escape(f"Livros publicados por {publisher.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/publishers/{publisher_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/publishers/{publisher_id}?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros publicados por {publisher.name}"),
+		html.escape(f"/opds/publishers/{publisher_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/categories", tags=["opds"])
 def opds_get_categories(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todas as categorias disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.categories.list(), max_items)
+	page = paginate(categories_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.categories.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -1936,34 +2254,35 @@ def opds_get_categories(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
 	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/categories?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Categorias ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/categories.jpg",
-		"Confira abaixo a lista de categorias"
-	) + opds.SELF_BASE.format(
-			f"/opds/categories?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/categories?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de categorias",
+		f"/opds/categories?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/categories/{category_id}", tags=["opds"])
 def opds_get_books_by_category(
 	category_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros presentes na categoria em questão.
@@ -1974,86 +2293,85 @@ def opds_get_books_by_category(
 	if category is None:
 		content = {"error": "category not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = category.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, year_id, None)
+	(objects_ids, counts) = books_facets.get(("categories", category_id), categories_index.get(category), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/categories/{category_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/categories/{category_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/categories/{category_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/categories/{category_id}", {"sort": "recent"}, sort == "recent")
+		],
+		excluded=("category_id",),
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros em {category.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/categories.jpg",
-		html.escape(f"Livros na categoria {category.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/categories/{category_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/categories/{category_id}?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros na categoria {category.name}"),
+		html.escape(f"/opds/categories/{category_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/types", tags=["opds"])
 def opds_get_types(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os tipos disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.types.list(), max_items)
+	page = paginate(types_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.types.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -2066,34 +2384,35 @@ def opds_get_types(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
 	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/types?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Tipos ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/types.jpg",
-		"Confira abaixo a lista de tipos"
-	) + opds.SELF_BASE.format(
-			f"/opds/types?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/types?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de tipos",
+		f"/opds/types?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/types/{type_id}", tags=["opds"])
 def opds_get_books_by_type(
 	type_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros do tipo em questão.
@@ -2104,86 +2423,85 @@ def opds_get_books_by_type(
 	if type is None:
 		content = {"error": "type not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = type.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (None, year_id, category_id)
+	(objects_ids, counts) = books_facets.get(("types", type_id), types_index.get(type), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/types/{type_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/types/{type_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/types/{type_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/types/{type_id}", {"sort": "recent"}, sort == "recent")
+		],
+		excluded=("type_id",),
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros do tipo {type.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/types.jpg",
-		html.escape(f"Livros do tipo {type.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/types/{type_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/types/{type_id}?page_number={next_page}"
-		)
+		html.escape(f"Livros do tipo {type.name}"),
+		html.escape(f"/opds/types/{type_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	content = base_feed + "".join(items) + "</feed>"
-	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/years", tags=["opds"])
 def opds_get_years(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Este método retornará uma lista contendo todos os anos disponíveis.
 	"""
 	
-	objects_pagination = create_pagination(plmcbks.years.list(), max_items)
+	page = paginate(years_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	objects = [plmcbks.years.get(object_id) for object_id in page["ids"]]
+	page_number = page["current_page"]
 	
 	items = [
 		opds.ITEM_BASE.format(
@@ -2196,34 +2514,35 @@ def opds_get_years(
 		) for entity in objects
 	]
 	
-	total_pages = len(objects_pagination) - 1 - page_number
+	total_pages = page["remaining_pages"]
 	
-	base_feed = opds.BASE.format(
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/years?cursor={page['next_cursor']}&max_items={max_items}")
+	
+	content = create_opds_feed(
 		f"Listagem de Anos ({page_number}/{total_pages})",
 		last_modified,
 		"https://polemicbooks.github.io/images/years.jpg",
-		"Confira abaixo a lista de anos"
-	) + opds.SELF_BASE.format(
-			f"years?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/years?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		"Confira abaixo a lista de anos",
+		f"years?page_number={page_number}",
+		next_href,
+		items
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/years/{year_id}", tags=["opds"])
 def opds_get_books_by_year(
 	year_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	sort: Optional[str] = Query(None, title="Ordem", description="Ordem dos livros (recent para os adicionados recentemente primeiro)", regex="^(?:recent)$")
 ):
 	"""
 	Este método retornará uma lista contendo todos os livros publicados no ano em questão.
@@ -2234,67 +2553,70 @@ def opds_get_books_by_year(
 	if year is None:
 		content = {"error": "year not found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	books = year.get_books(plmcbks.books)
-	objects_pagination = create_pagination(books.list(), max_items)
+	filters = (type_id, None, category_id)
+	(objects_ids, counts) = books_facets.get(("years", year_id), years_index.get(year), filters, reverse=sort == "recent")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id" if sort == "recent" else "id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/years/{year_id}?{books_facets.create_query(filters, sort=sort, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		f"/opds/years/{year_id}",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", f"/opds/years/{year_id}", {"sort": None}, sort is None),
+			("Mais recentes", f"/opds/years/{year_id}", {"sort": "recent"}, sort == "recent")
+		],
+		excluded=("year_id",),
+		sort=sort,
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros do tipo {year.name} ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/years.jpg",
-		html.escape(f"Livros do tipo {year.name}")
-	) + opds.SELF_BASE.format(
-			f"/opds/years/{year_id}?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/years/{year_id}?page_number={next_page}"
-		)
+		html.escape(f"Livros do tipo {year.name}"),
+		html.escape(f"/opds/years/{year_id}?{books_facets.create_query(filters, sort=sort, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	content = base_feed + "".join(items) + "</feed>"
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
+
+
+@app.get("/opds/opensearch.xml", tags=["opds"])
+def opds_opensearch():
+	"""
+	Este método retornará o documento de descrição OpenSearch usado pelos clientes OPDS para pesquisar por livros.
+	"""
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return Response(content=opensearch_description, media_type="application/opensearchdescription+xml")
 
 
 @app.get("/opds/search/books", tags=["opds"])
@@ -2302,223 +2624,887 @@ def opds_search_books(
 	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
 	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
 ):
 	"""
 	Use este método para pesquisar por livros.
 	"""
 	
-	if search_type == "fast":
-		results = plmcbks.books.fast_search(query_name)
-	else:
-		results = plmcbks.books.slow_search(query_name)
+	objects_ids = searches.get("books", plmcbks.books, query_name, search_type)
 	
-	if not results:
+	if not objects_ids:
 		content = {"error": "no books found"}
 		status_code = status.HTTP_404_NOT_FOUND
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects_pagination = create_pagination(results.list(), max_items)
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
 		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
 	
-	items = []
+	next_href = None
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	if page["next_cursor"] is not None:
+		next_href = html.escape("/opds/search/books?" + urllib.parse.urlencode({
+			"query_name": query_name,
+			"search_type": search_type,
+			"cursor": page["next_cursor"],
+			"max_items": max_items
+		}))
+	
+	content = create_opds_feed(
 		html.escape(f"Resultados da Pesquisa ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/search.jpg",
-		html.escape("Resultados")
-	) + opds.SELF_BASE.format(
-			html.escape(f"/opds/search/books?query_name={query_name}&page_number={page_number}")
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			html.escape(f"/opds/search/books?query_name={query_name}&page_number={next_page}")
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape("Resultados"),
+		html.escape("/opds/search/books?" + urllib.parse.urlencode({
+			"query_name": query_name,
+			"search_type": search_type,
+			"page_number": page_number,
+			"max_items": max_items
+		})),
+		next_href,
+		opds_entries.iter(page["ids"], page_number)
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/recent-books", tags=["opds"])
 def opds_recent_books(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID)
 ):
 	"""
 	Use este método para obter is livros publicados recentemente.
 	"""
 	
-	books = plmcbks.books.list()
-	books.reverse()
-	
-	objects_pagination = create_pagination(books, max_items)
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get("books", books_ids, filters, reverse=True)
 	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/recent-books?{books_facets.create_query(filters, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		"/opds/recent-books",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", "/opds/old-books", {}, False),
+			("Mais recentes", "/opds/recent-books", {}, True)
+		],
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros adicionados recentemente ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/books.jpg",
-		html.escape(f"Livros recentes")
-	) + opds.SELF_BASE.format(
-			f"/opds/recent-books?page_number={page_number}"
-		)
-	
-	next_page = page_number + 1
-	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/recent-books?page_number={next_page}"
-		)
-	
-	content = base_feed + "".join(items) + "</feed>"
+		html.escape(f"Livros recentes"),
+		html.escape(f"/opds/recent-books?{books_facets.create_query(filters, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
 	
-	return Response(content=content, media_type="application/atom+xml")
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
 
 
 @app.get("/opds/old-books", tags=["opds"])
 def opds_old_books(
 	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
-	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS)
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH),
+	type_id: Optional[int] = Query(None, title="Tipo", description="Identificação do tipo dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	year_id: Optional[int] = Query(None, title="Ano", description="Identificação do ano dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID),
+	category_id: Optional[int] = Query(None, title="Categoria", description="Identificação da categoria dos livros (faceta)", ge=limits.MIN_ID, le=limits.MAX_ID)
 ):
 	"""
 	Use este método para obter os livros antigos.
 	"""
 	
-	books = plmcbks.books.list()
+	filters = (type_id, year_id, category_id)
+	(objects_ids, counts) = books_facets.get("books", books_ids, filters, reverse=False)
 	
-	objects_pagination = create_pagination(books, max_items)
-	
-	if page_number > len(objects_pagination):
-		content = {"error": "page_number value is out of range"}
-		status_code = status.HTTP_400_BAD_REQUEST
-		return JSONResponse(content=content, status_code=status_code)
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
 	
-	objects = objects_pagination[page_number]
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="id")
 	
-	items = []
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page_number = page["current_page"]
+	total_pages = page["remaining_pages"]
+	
+	next_href = None
+	
+	if page["next_cursor"] is not None:
+		next_href = html.escape(f"/opds/old-books?{books_facets.create_query(filters, cursor=page['next_cursor'], max_items=max_items)}")
+	
+	facets = create_opds_facets(
+		books_facets,
+		"/opds/old-books",
+		filters,
+		counts,
+		len(objects_ids),
+		[
+			("Mais antigos", "/opds/old-books", {}, True),
+			("Mais recentes", "/opds/recent-books", {}, False)
+		],
+		max_items=max_items
+	)
 	
-	for book in objects:
-		item = ""
-		item += f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
-		item += f"\n  <id>book:{book.id}</id>"
-		item += "\n  <updated>{}</updated>".format(
-			time.strftime(
-				"%a, %d %b %Y %H:%M:%S GMT", time.localtime(book.date))
-		)
-		item += f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
-		item += f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{book.documents[0].id}"\n		type="{book.documents[0].mime_type}"/>'
-		if book.author is not None:
-			item += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number={page_number}</uri>\n  </author>"
-		item += "\n  <dc:language>pt</dc:language>"
-		if book.publisher is not None:
-			item += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
-		if book.year is not None:
-			item += f"\n  <dc:issued>{book.year.name}</dc:issued>"
-		if book.category is not None:
-			item += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
-		if book.type is not None:
-			item += f"\n  <summary>{book.type.name}</summary>"
-		item += f'<content type="xhtml">{html.escape(create_caption(book))}'
-		item += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(book.documents[0].id)}">{book.title + "." + book.documents[0].file_extension if book.title is not None else "document." + book.documents[0].file_extension}</a></em>')
-		item += "</content>\n</entry>"
-		items.append(item)
-	
-	total_pages = len(objects_pagination) - 1 - page_number
-	
-	base_feed = opds.BASE.format(
+	content = create_opds_feed(
 		html.escape(f"Livros antigos ({page_number}/{total_pages})"),
 		last_modified,
 		"https://polemicbooks.github.io/images/books.jpg",
-		html.escape(f"Livros antigos")
-	) + opds.SELF_BASE.format(
-			f"/opds/old-books?page_number={page_number}"
-		)
+		html.escape(f"Livros antigos"),
+		html.escape(f"/opds/old-books?{books_facets.create_query(filters, page_number=page_number)}"),
+		next_href,
+		opds_entries.iter(page["ids"], page_number),
+		facets
+	)
+	
+	return create_feed_response(content, len(page["ids"]), "application/atom+xml")
+
+
+@app.get("/opds2", tags=["opds2"])
+def opds2_home():
+	"""
+	Este método retornará uma listagem (OPDS 2.0) com opções disponíveis para navegação.
+	"""
 	
-	next_page = page_number + 1
+	entries = [
+		("Autores", "/opds2/authors"),
+		("Artistas", "/opds2/artists"),
+		("Narradores", "/opds2/narrators"),
+		("Editoras", "/opds2/publishers"),
+		("Categorias", "/opds2/categories"),
+		("Tipos", "/opds2/types"),
+		("Anos", "/opds2/years"),
+		("Recentes", "/opds2/recent-books"),
+		("Antigos", "/opds2/old-books")
+	]
 	
-	if next_page < total_pages:
-		base_feed += opds.NEXT_PAGE_BASE.format(
-			f"/opds/old-books?page_number={next_page}"
-		)
+	content = {
+		"metadata": {
+			"title": "Polemic Books",
+			"description": "Pesquise ou baixe ebooks, audiobooks, comics e mangás."
+		},
+		"links": [
+			{"rel": "self", "href": "/opds2", "type": opds2.MEDIA_TYPE},
+			{"rel": "search", "href": opds2.SEARCH_HREF, "type": opds2.MEDIA_TYPE, "templated": True}
+		],
+		"navigation": [
+			{"href": href, "title": title, "type": opds2.MEDIA_TYPE, "rel": "subsection"}
+			for (title, href) in entries
+		]
+	}
+	
+	return Response(content=JSON_FORMAT.dump(content), media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/authors", tags=["opds2"])
+def opds2_get_authors(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os autores disponíveis.
+	"""
 	
-	content = base_feed + "".join(items) + "</feed>"
+	page = paginate(authors_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
 	
-	return Response(content=content, media_type="application/atom+xml")
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Autores",
+		create_opds2_links("/opds2/authors", page, max_items),
+		"navigation",
+		opds2_navigations["authors"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/authors/{author_id}", tags=["opds2"])
+def opds2_get_books_by_author(
+	author_id: int = Path(..., title="Identificação numérica do autor", description="Identificação do autor.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao autor em questão.
+	"""
+	
+	author = plmcbks.authors.get(author_id)
+	
+	if author is None:
+		content = {"error": "author not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(authors_index.get(author), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros escritos por {author.name}",
+		create_opds2_links(f"/opds2/authors/{author_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/artists", tags=["opds2"])
+def opds2_get_artists(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os artistas disponíveis.
+	"""
+	
+	page = paginate(artists_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Artistas",
+		create_opds2_links("/opds2/artists", page, max_items),
+		"navigation",
+		opds2_navigations["artists"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/artists/{artist_id}", tags=["opds2"])
+def opds2_get_books_by_artist(
+	artist_id: int = Path(..., title="Identificação numérica do artista", description="Identificação do artista.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao artista em questão.
+	"""
+	
+	artist = plmcbks.artists.get(artist_id)
+	
+	if artist is None:
+		content = {"error": "artist not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(artists_index.get(artist), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros ilustrados por {artist.name}",
+		create_opds2_links(f"/opds2/artists/{artist_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/narrators", tags=["opds2"])
+def opds2_get_narrators(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os narradores disponíveis.
+	"""
+	
+	page = paginate(narrators_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Narradores",
+		create_opds2_links("/opds2/narrators", page, max_items),
+		"navigation",
+		opds2_navigations["narrators"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/narrators/{narrator_id}", tags=["opds2"])
+def opds2_get_books_by_narrator(
+	narrator_id: int = Path(..., title="Identificação numérica do narrador", description="Identificação do narrador.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao narrador em questão.
+	"""
+	
+	narrator = plmcbks.narrators.get(narrator_id)
+	
+	if narrator is None:
+		content = {"error": "narrator not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(narrators_index.get(narrator), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros narrados por {narrator.name}",
+		create_opds2_links(f"/opds2/narrators/{narrator_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/publishers", tags=["opds2"])
+def opds2_get_publishers(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os editoras disponíveis.
+	"""
+	
+	page = paginate(publishers_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Editoras",
+		create_opds2_links("/opds2/publishers", page, max_items),
+		"navigation",
+		opds2_navigations["publishers"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/publishers/{publisher_id}", tags=["opds2"])
+def opds2_get_books_by_publisher(
+	publisher_id: int = Path(..., title="Identificação numérica do editora", description="Identificação do editora.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao editora em questão.
+	"""
+	
+	publisher = plmcbks.publishers.get(publisher_id)
+	
+	if publisher is None:
+		content = {"error": "publisher not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(publishers_index.get(publisher), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros publicados por {publisher.name}",
+		create_opds2_links(f"/opds2/publishers/{publisher_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/categories", tags=["opds2"])
+def opds2_get_categories(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os categorias disponíveis.
+	"""
+	
+	page = paginate(categories_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Categorias",
+		create_opds2_links("/opds2/categories", page, max_items),
+		"navigation",
+		opds2_navigations["categories"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/categories/{category_id}", tags=["opds2"])
+def opds2_get_books_by_category(
+	category_id: int = Path(..., title="Identificação numérica do categoria", description="Identificação do categoria.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao categoria em questão.
+	"""
+	
+	category = plmcbks.categories.get(category_id)
+	
+	if category is None:
+		content = {"error": "category not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(categories_index.get(category), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros na categoria {category.name}",
+		create_opds2_links(f"/opds2/categories/{category_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/types", tags=["opds2"])
+def opds2_get_types(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os tipos disponíveis.
+	"""
+	
+	page = paginate(types_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Tipos",
+		create_opds2_links("/opds2/types", page, max_items),
+		"navigation",
+		opds2_navigations["types"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/types/{type_id}", tags=["opds2"])
+def opds2_get_books_by_type(
+	type_id: int = Path(..., title="Identificação numérica do tipo", description="Identificação do tipo.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao tipo em questão.
+	"""
+	
+	type = plmcbks.types.get(type_id)
+	
+	if type is None:
+		content = {"error": "type not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(types_index.get(type), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros do tipo {type.name}",
+		create_opds2_links(f"/opds2/types/{type_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/years", tags=["opds2"])
+def opds2_get_years(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade máxima de itens", description="Quantidade máxima de itens", ge=limits.MIN_FEED_ITEMS, le=limits.MAX_FEED_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os anos disponíveis.
+	"""
+	
+	page = paginate(years_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="catalog")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Listagem de Anos",
+		create_opds2_links("/opds2/years", page, max_items),
+		"navigation",
+		opds2_navigations["years"],
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/years/{year_id}", tags=["opds2"])
+def opds2_get_books_by_year(
+	year_id: int = Path(..., title="Identificação numérica do ano", description="Identificação do ano.", ge=limits.MIN_ID, le=limits.MAX_ID),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Este método retornará uma lista (OPDS 2.0) contendo todos os livros relacionados ao ano em questão.
+	"""
+	
+	year = plmcbks.years.get(year_id)
+	
+	if year is None:
+		content = {"error": "year not found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(years_index.get(year), page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		f"Livros do ano {year.name}",
+		create_opds2_links(f"/opds2/years/{year_id}", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/search/books", tags=["opds2"])
+def opds2_search_books(
+	query_name: str = Query(..., title="Termo a ser pesquisado", description="Termo a ser pesquisado", min_length=limits.MIN_QUERY_LENGTH, max_length=limits.MAX_QUERY_LENGTH),
+	search_type: Optional[str] = Query("fast", title="Tipo de pesquisa", description="Tipo de pesquisa", regex="^(?:fast|slow)$"),
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Use este método para pesquisar por livros (OPDS 2.0).
+	"""
+	
+	objects_ids = searches.get("books", plmcbks.books, query_name, search_type)
+	
+	if not objects_ids:
+		content = {"error": "no books found"}
+		status_code = status.HTTP_404_NOT_FOUND
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	page = paginate(objects_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="relevance")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Resultados da Pesquisa",
+		create_opds2_links("/opds2/search/books?" + urllib.parse.urlencode({"query_name": query_name, "search_type": search_type}), page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/recent-books", tags=["opds2"])
+def opds2_recent_books(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Use este método para obter os livros publicados recentemente (OPDS 2.0).
+	"""
+	
+	page = paginate(recent_books_ids, page_number, max_items, cursor=cursor, version=catalog_version, sort="-id")
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Livros adicionados recentemente",
+		create_opds2_links("/opds2/recent-books", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.get("/opds2/old-books", tags=["opds2"])
+def opds2_old_books(
+	page_number: Optional[int] = Query(0, title="Posição da página", description="Posição da página", ge=limits.MIN_PAGE_NUMBER, le=limits.MAX_PAGE_NUMBER),
+	max_items: Optional[int] = Query(100, title="Quantidade de itens", description="Quantidade máxima de itens", ge=limits.MIN_PAGE_ITEMS, le=limits.MAX_PAGE_ITEMS),
+	cursor: Optional[str] = Query(None, title="Cursor", description="Cursor da página (next_cursor ou previous_cursor); quando informado, page_number é ignorado", max_length=limits.MAX_CURSOR_LENGTH)
+):
+	"""
+	Use este método para obter os livros antigos (OPDS 2.0).
+	"""
+	
+	page = paginate(books_ids, page_number, max_items, cursor=cursor, version=catalog_version)
+	
+	if page is None:
+		if cursor is not None:
+			content = {"error": "cursor value is invalid"}
+		else:
+			content = {"error": "page_number value is out of range"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = create_opds2_feed(
+		"Livros antigos",
+		create_opds2_links("/opds2/old-books", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+	
+	return Response(content=content, media_type=opds2.MEDIA_TYPE)
+
+
+@app.on_event("startup")
+async def build_snapshot() -> None:
+	"""
+	Este método gera a cópia completa do acervo em segundo plano, caso ela ainda
+	não exista para a versão atual.
+	"""
+	
+	snapshot.start(asyncio.get_event_loop())
+
+
+@app.on_event("startup")
+def load_storage() -> None:
+	"""
+	Este método atualiza o histórico de alterações do acervo e carrega o índice
+	dos documentos já baixados. Ambos alteram arquivos em disco, por isso não são
+	carregados junto da aplicação (que também é importada por scripts, como o
+	scripts/export_static.py).
+	"""
+	
+	changelog.update(catalog_version, exports)
+	downloads_cache.load()
+
+
+@app.post("/batch", tags=["lote"])
+async def batch_requests(
+	request: Request,
+	subrequests: List[Subrequest] = Body(..., title="Consultas", description="Consultas a serem executadas")
+):
+	"""
+	Este método executará várias consultas (apenas endpoints de leitura em JSON) em uma única requisição, retornando os resultados na mesma ordem das consultas.
+	"""
+	
+	if len(subrequests) > batch.MAX_REQUESTS:
+		content = {"error": "too many requests"}
+		status_code = status.HTTP_400_BAD_REQUEST
+		return FastJSONResponse(content=content, status_code=status_code)
+	
+	content = await execute_batch(app, request.scope, subrequests, response_format.get())
+	
+	return FastJSONResponse(content=content)
+
+
+@app.get("/status/cache", tags=["estado"])
+def get_cache_status():
+	"""
+	Este método retornará informações sobre o cache de respostas, incluindo a taxa de acertos de cada endpoint.
+	"""
+	
+	return FastJSONResponse(content=response_cache.get_statistics())
 
 
 async def build_clients() -> None:
@@ -2536,7 +3522,7 @@ async def build_clients() -> None:
 	await pclient.start()
 	
 	clients_ok = True
-	
+
 if __name__ == "__main__":
 	
 	parser = argparse.ArgumentParser()
@@ -2555,4 +3541,3 @@ if __name__ == "__main__":
 		headers=headers.HTTP_HEADERS
 	)
 
-	
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Quantidade máxima de consultas em uma única requisição ao /batch.
+MAX_REQUESTS = 25
+
+# Quantidade máxima de consultas executadas ao mesmo tempo.
+MAX_CONCURRENCY = 8
+
+# Tamanho máximo do caminho (incluindo os parâmetros) de cada consulta.
+MAX_PATH_LENGTH = 2000
+
+# Endpoints que podem ser consultados através do /batch (apenas leitura, em JSON).
+ALLOWED_PATHS = [
+	"/books",
+	"/categories",
+	"/authors",
+	"/artists",
+	"/narrators",
+	"/publishers",
+	"/types",
+	"/years",
+	"/search",
+	"/documents",
+	"/covers",
+	"/changes"
+]
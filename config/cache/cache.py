@@ -0,0 +1,41 @@
+# Tamanho máximo (em bytes) ocupado pelas respostas guardadas em memória.
+MAX_SIZE = 128 * 1024 * 1024
+
+# Respostas maiores que isso (em bytes) não são guardadas.
+MAX_ENTRY_SIZE = 8 * 1024 * 1024
+
+# Endpoints cujas respostas nunca são guardadas (downloads, imagens, o feed RSS,
+# que possui um cache próprio, etc.).
+EXCLUDED_PATHS = [
+	"/download",
+	"/view",
+	"/export",
+	"/events",
+	"/rss",
+	"/status"
+]
+
+# Endpoints cujas respostas não recebem ETag nem Last-Modified (nem são
+# respondidas com 304), já que o conteúdo muda enquanto a aplicação está em
+# execução (ex: as estatísticas do cache e o fluxo de eventos).
+UNVERSIONED_PATHS = [
+	"/events",
+	"/status"
+]
+
+# Quantidade máxima de variantes (caminho, parâmetros, formato e compressão) cujos
+# cabeçalhos de validação (ETag, Last-Modified e Vary) são guardados em memória,
+# para que as requisições condicionais sejam respondidas sem executar o endpoint.
+MAX_VALIDATORS = 16384
+
+# Quantidade máxima de listas de livros filtradas pelas facetas dos feeds OPDS
+# (junto das contagens de cada faceta) guardadas em memória.
+MAX_FACET_ENTRIES = 512
+
+# Tamanho máximo (em bytes) ocupado pelos feeds RSS de entidades (já montados e
+# comprimidos) guardados em memória.
+MAX_RSS_SIZE = 32 * 1024 * 1024
+
+# Quantidade máxima de pesquisas (identificações dos resultados) guardadas em
+# memória.
+MAX_SEARCHES = 1024
@@ -0,0 +1,10 @@
+# Tamanho mínimo (em bytes) para que uma resposta seja comprimida.
+MINIMUM_SIZE = 1024
+
+# Níveis de compressão de cada algoritmo.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 10
+
+# Ordem de preferência dos algoritmos, quando o cliente aceita mais de um.
+ENCODINGS = ["br", "zstd", "gzip"]
@@ -0,0 +1,17 @@
+import os
+
+
+# Diretório onde os documentos baixados do Telegram são guardados.
+DOWNLOADS_DIRECTORY = os.path.join(os.getcwd(), "downloads")
+
+# Tamanho máximo (em bytes) ocupado pelos documentos guardados em disco. Os
+# documentos usados há mais tempo são removidos primeiro.
+MAX_SIZE = 20 * 1024 * 1024 * 1024
+
+# Documentos maiores que isso (em bytes) não são guardados.
+MAX_FILE_SIZE = 2 * 1024 * 1024 * 1024
+
+# Tamanho (em bytes) das partes em que os documentos são baixados do Telegram.
+# Downloads parciais (cabeçalho Range) começam na parte que contém o primeiro
+# byte solicitado.
+TELEGRAM_CHUNK_SIZE = 1024 * 1024
@@ -0,0 +1,15 @@
+# Intervalo (em segundos) entre os comentários enviados para manter as conexões
+# abertas quando não há novos livros.
+HEARTBEAT_INTERVAL = 15
+
+# Tempo (em milissegundos) que o cliente deve esperar antes de reconectar.
+RETRY_INTERVAL = 10000
+
+# Quantidade máxima de livros enviados ao retomar a conexão (Last-Event-ID).
+MAX_RESUME_EVENTS = 1000
+
+# Quantidade de livros enviados em cada parte do stream.
+CHUNK_EVENTS = 100
+
+# Quantidade máxima de conexões abertas ao mesmo tempo.
+MAX_CONNECTIONS = 10000
@@ -0,0 +1,16 @@
+import os
+
+
+# Diretório onde as cópias completas do acervo são guardadas.
+SNAPSHOTS_DIRECTORY = os.path.join(os.getcwd(), "snapshots")
+
+# Nível de compressão das cópias completas (Zstandard ou gzip).
+SNAPSHOT_ZSTD_LEVEL = 19
+SNAPSHOT_GZIP_LEVEL = 9
+
+# Diretório onde o histórico de alterações do acervo é guardado.
+CHANGELOG_DIRECTORY = os.path.join(os.getcwd(), "changelog")
+
+# Quantidade de versões mantidas no histórico. Clientes com versões mais antigas
+# precisam sincronizar o acervo completo novamente.
+MAX_CHANGELOG_VERSIONS = 30
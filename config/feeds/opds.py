@@ -3,7 +3,8 @@ BASE = """\
 <feed xmlns="http://www.w3.org/2005/Atom"
         xmlns:dc="http://purl.org/dc/terms/"
         xmlns:opds="http://opds-spec.org/2010/catalog"
-        xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+        xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+        xmlns:thr="http://purl.org/syndication/thread/1.0">
   <title>{}</title>
   <updated>{}</updated>
   <link rel="http://opds-spec.org/image"
@@ -14,6 +15,10 @@ BASE = """\
         href="/opds/search/books?query_name={{searchTerms}}"
         type="application/atom+xml"
         title="Buscar no Polemic Books"/>
+  <link rel="search"
+        href="/opds/opensearch.xml"
+        type="application/opensearchdescription+xml"
+        title="Buscar no Polemic Books"/>
   <author>
     <name>Polemic Books</name>
     <uri>https://t.me/PolemicBooks</uri>
@@ -49,6 +54,26 @@ SELF_BASE = """\
         type="application/atom+xml"/>
 """
 
+FACET_BASE = """\
+  <link rel="http://opds-spec.org/facet"
+        href="{}"
+        type="application/atom+xml;profile=opds-catalog;kind=acquisition"
+        title="{}"
+        opds:facetGroup="{}"
+        opds:activeFacet="{}"
+        thr:count="{}"/>
+"""
+
+# Facetas dos feeds de livros: parâmetro, atributo do livro e nome do grupo
+FACET_GROUPS = [
+	("type_id", "type", "Tipo"),
+	("year_id", "year", "Ano"),
+	("category_id", "category", "Categoria")
+]
+
+# Grupo das facetas de ordenação
+SORT_FACET_GROUP = "Ordem"
+
 RELATED_BASE = """
   <link rel="related"
         href="{}"
@@ -0,0 +1,5 @@
+# Tipo de conteúdo dos feeds OPDS 2.0
+MEDIA_TYPE = "application/opds+json"
+
+# Link de busca (modelo de URI) incluído na página inicial
+SEARCH_HREF = "/opds2/search/books{?query_name}"
@@ -0,0 +1,26 @@
+from ..urls import urls
+
+# Documento de descrição OpenSearch dos feeds OPDS. As URLs aceitam a pesquisa
+# rápida (fast) e a lenta (slow). A página e a quantidade de itens não são
+# parâmetros dos modelos, já que os clientes preenchem os parâmetros opcionais
+# que não informam com um valor vazio (inválido para a API); as próximas páginas
+# são obtidas pelos links de cada feed.
+DESCRIPTION = f"""\
+<?xml version="1.0" encoding="utf-8"?>
+<OpenSearchDescription xmlns="http://a9.com/-/spec/opensearch/1.1/">
+  <ShortName>Polemic Books</ShortName>
+  <Description>Pesquise por ebooks, audiobooks, comics e mangás.</Description>
+  <Tags>livros ebooks audiobooks comics mangás</Tags>
+  <Image type="image/jpeg">https://polemicbooks.github.io/images/polemicbooks.jpg</Image>
+  <Url type="application/atom+xml;profile=opds-catalog;kind=acquisition"
+       template="{urls.API_URL}/opds/search/books?query_name={{searchTerms}}&amp;search_type=fast"/>
+  <Url type="application/atom+xml;profile=opds-catalog;kind=acquisition"
+       template="{urls.API_URL}/opds/search/books?query_name={{searchTerms}}&amp;search_type=slow"/>
+  <Url type="application/opds+json"
+       template="{urls.API_URL}/opds2/search/books?query_name={{searchTerms}}&amp;search_type=fast"/>
+  <Query role="example" searchTerms="machado de assis"/>
+  <Language>pt-BR</Language>
+  <InputEncoding>UTF-8</InputEncoding>
+  <OutputEncoding>UTF-8</OutputEncoding>
+</OpenSearchDescription>
+"""
@@ -26,4 +26,31 @@ ITEM_BASE = """\
       <pubDate>{}</pubDate>
       <description>{}</description>
     </item>
-"""
\ No newline at end of file
+"""
+# Feed dos livros relacionados a uma entidade (título, descrição, caminho e itens)
+ENTITY_BASE = f"""\
+<?xml version="1.0" encoding="utf-8" ?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>{{}}</title>
+    <link>https://t.me/PolemicBooks</link>
+    <description>{{}}</description>
+    <language>pt-BR</language>
+    <category>Livros</category>
+    <ttl>60</ttl>
+    <atom:link href="{urls.API_URL}{{}}" rel="self" type="application/rss+xml" />
+{{}}
+  </channel>
+</rss>
+"""
+
+# Descrição do feed de cada coleção de entidades
+ENTITY_DESCRIPTIONS = {
+	"authors": "Últimos livros escritos por {}",
+	"artists": "Últimos livros ilustrados por {}",
+	"narrators": "Últimos livros narrados por {}",
+	"publishers": "Últimos livros publicados por {}",
+	"categories": "Últimos livros na categoria {}",
+	"types": "Últimos livros do tipo {}",
+	"years": "Últimos livros do ano {}"
+}
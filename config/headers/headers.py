@@ -4,7 +4,6 @@ HTTP_HEADERS = [
 	("Access-Control-Allow-Origin", "*"),
 	("Access-Control-Expose-Headers", "*"),
 	("Access-Control-Max-Age", "3600"),
-	("Cache-Control", "public, max-age=3600"),
 	("Cross-Origin-Embedder-Policy", "require-corp"),
 	("Cross-Origin-Opener-Policy", "same-origin"),
 	("Cross-Origin-Resource-Policy", "cross-origin"),
@@ -22,7 +21,6 @@ HTTP_HEADERS = [
 			"navigate-to 'none'"
 		]
 	)),
-	("Accept-Ranges", "none"),
 	("Permissions-Policy", ", ".join(
 		[
 			"accelerometer=()",
@@ -69,3 +67,12 @@ HTTP_HEADERS = [
 		]
 	))
 ]
+
+# Cabeçalho Cache-Control das respostas que não definem um próprio. Não faz parte
+# dos cabeçalhos acima porque os endpoints cujo conteúdo muda enquanto a aplicação
+# está em execução (ex: /events e /status) usam outro valor.
+CACHE_CONTROL = "public, max-age=3600"
+
+# Cabeçalho Cache-Control dos endpoints cujo conteúdo muda enquanto a aplicação
+# está em execução (cache.UNVERSIONED_PATHS)
+UNVERSIONED_CACHE_CONTROL = "no-store"
@@ -5,6 +5,16 @@ MAX_PAGE_NUMBER = 200000
 MIN_PAGE_ITEMS = 1
 MAX_PAGE_ITEMS = 1000
 
+# Tamanho máximo do cursor de paginação
+MAX_CURSOR_LENGTH = 200
+
+# Projeção de campos (parâmetro fields)
+MAX_FIELDS_LENGTH = 500
+MAX_PROJECTIONS = 32
+
+# Quantidade de objetos enviados por vez nas exportações
+EXPORT_CHUNK_ITEMS = 1000
+
 # Ranges de identificação numérica para entidades, documentos e livros.
 MIN_ID = 0
 MAX_ID = 200000
@@ -15,4 +25,11 @@ MAX_QUERY_LENGTH = 270
 
 # RSS
 MIN_FEED_ITEMS = 15
-MAX_FEED_ITEMS = 5000
\ No newline at end of file
+MAX_FEED_ITEMS = 5000
+
+# Quantidades de itens do feed RSS que são montadas (e comprimidas) com antecedência.
+RSS_BUCKETS = [15, 25, 50, 100, 200]
+
+# Feeds (OPDS e RSS) com mais itens que isso são enviados aos poucos, em blocos.
+STREAMING_FEED_ITEMS = 500
+FEED_CHUNK_ITEMS = 100
\ No newline at end of file
@@ -12,6 +12,10 @@ TAGS = [
 		"name": "buscas",
 		"description": "Busque por entidades ou livros."
 	},
+	{
+		"name": "exportações",
+		"description": "Exporte todos os objetos de uma coleção em uma única requisição."
+	},
 	{
 		"name": "rss",
 		"description": "Feed RSS que retorna informações sobre as últimas adições."
@@ -19,5 +23,21 @@ TAGS = [
 	{
 		"name": "opds",
 		"description": "Navegue entre livros usando um servidor OPDS 1.2."
+	},
+	{
+		"name": "opds2",
+		"description": "Navegue entre livros usando um servidor OPDS 2.0 (JSON)."
+	},
+	{
+		"name": "eventos",
+		"description": "Receba notificações dos livros adicionados ao acervo (Server-Sent Events)."
+	},
+	{
+		"name": "lote",
+		"description": "Execute várias consultas em uma única requisição."
+	},
+	{
+		"name": "estado",
+		"description": "Informações sobre o funcionamento da API."
 	}
 ]
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+# Compara o tempo gasto para gerar as respostas JSON de /books e /search/books
+# usando o caminho antigo (jsonable_encoder + JSONResponse) e o atual
+# (fragmentos pré-serializados + FastJSONResponse).
+#
+# Também compara os feeds OPDS 1.2 (Atom) e OPDS 2.0 (JSON) de /recent-books.
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+import plmcbks
+
+from utils.books import BooksFormatting
+from utils.feeds import OPDSEntries, create_opds_feed
+from utils.opds2 import create_opds2_publications, create_opds2_links, create_opds2_feed
+from utils.paginations import create_pagination, create_page, paginate
+from utils.responses import FastJSONResponse
+from utils.serialization import Fragments, JSON_BACKEND
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument("--max-items", type=int, default=1000, help="items per page")
+parser.add_argument("--query", default="historia", help="search term for /search/books")
+parser.add_argument("--repeat", type=int, default=20, help="number of runs per case")
+
+options = parser.parse_args()
+
+
+def legacy_page(objects, page_number, max_items):
+	
+	objects_pagination = create_pagination(objects, max_items)
+	objects = objects_pagination[page_number]
+	
+	data = {
+		"pagination": {
+			"total_pages": len(objects_pagination),
+			"remaining_pages": len(objects_pagination) - 1 - page_number,
+			"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
+			"current_page": page_number,
+			"next_page":  (page_number + 1) if (page_number + 1) < len(objects_pagination) else None
+		},
+		"results": {
+			"total_results": sum(len(page) for page in objects_pagination),
+			"max_results": max_items,
+			"display_results": len(objects),
+			"items": objects
+		}
+	}
+	
+	return JSONResponse(content=jsonable_encoder(data)).body
+
+
+def current_page(objects_ids, page_number, max_items):
+	
+	content = create_page(books_fragments, objects_ids, page_number, max_items)
+	
+	return FastJSONResponse(content=content).body
+
+
+def atom_feed(objects_ids, page_number, max_items):
+	
+	page = paginate(objects_ids, page_number, max_items, sort="-id")
+	
+	content = create_opds_feed(
+		"Livros adicionados recentemente",
+		"",
+		"https://polemicbooks.github.io/images/books.jpg",
+		"Livros recentes",
+		"/opds/recent-books",
+		None,
+		opds_entries.iter(page["ids"], page["current_page"])
+	)
+	
+	return "".join(content).encode("utf-8")
+
+
+def opds2_feed(objects_ids, page_number, max_items):
+	
+	page = paginate(objects_ids, page_number, max_items, sort="-id")
+	
+	return create_opds2_feed(
+		"Livros adicionados recentemente",
+		create_opds2_links("/opds2/recent-books", page, max_items),
+		"publications",
+		opds2_publications,
+		page,
+		max_items
+	)
+
+
+books_list = list(plmcbks.books)
+books_ids = [book.id for book in books_list]
+books_fragments = Fragments(books_list)
+
+books_formatting = BooksFormatting(books_list)
+opds_entries = OPDSEntries(plmcbks.books, books_formatting)
+opds2_publications = create_opds2_publications(books_list, books_formatting)
+
+cases = [
+	(
+		f"/books?max_items={options.max_items}",
+		lambda: legacy_page(books_list, 0, options.max_items),
+		lambda: current_page(books_ids, 0, options.max_items)
+	),
+	(
+		f"/search/books?query_name={options.query}&max_items={options.max_items}",
+		lambda: legacy_page(
+			list(plmcbks.books.fast_search(options.query)), 0, options.max_items),
+		lambda: current_page(
+			[book.id for book in plmcbks.books.fast_search(options.query)], 0, options.max_items)
+	)
+]
+
+print(f"JSON backend: {JSON_BACKEND}")
+
+for (endpoint, legacy, current) in cases:
+	legacy_time = min(timeit.repeat(legacy, number=1, repeat=options.repeat))
+	current_time = min(timeit.repeat(current, number=1, repeat=options.repeat))
+	
+	print(
+		f"{endpoint}\n"
+		f"  legacy:  {legacy_time * 1000:.2f} ms ({len(legacy())} bytes)\n"
+		f"  current: {current_time * 1000:.2f} ms ({len(current())} bytes)\n"
+		f"  speedup: {legacy_time / current_time:.1f}x"
+	)
+
+feed_cases = [
+	(
+		f"/opds/recent-books?max_items={options.max_items} x /opds2/recent-books?max_items={options.max_items}",
+		lambda: atom_feed(books_ids[::-1], 0, options.max_items),
+		lambda: opds2_feed(books_ids[::-1], 0, options.max_items)
+	)
+]
+
+for (endpoint, atom, opds2) in feed_cases:
+	atom_time = min(timeit.repeat(atom, number=1, repeat=options.repeat))
+	opds2_time = min(timeit.repeat(opds2, number=1, repeat=options.repeat))
+	
+	print(
+		f"{endpoint}\n"
+		f"  atom:    {atom_time * 1000:.2f} ms ({len(atom())} bytes)\n"
+		f"  opds2:   {opds2_time * 1000:.2f} ms ({len(opds2())} bytes)\n"
+		f"  speedup: {atom_time / opds2_time:.1f}x"
+	)
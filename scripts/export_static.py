@@ -0,0 +1,299 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+# Gera uma cópia estática do acervo (feeds OPDS 1.2 e 2.0, feed RSS, listagens
+# JSON e informações das mídias) em um diretório, junto das versões comprimidas
+# (.gz e .br) de cada arquivo, para que ela seja servida diretamente por um
+# servidor web. Apenas as buscas, as facetas e os downloads continuam sendo
+# respondidos pela API.
+#
+# Cada URL é salva em <caminho>/index (sem parâmetros) ou em
+# <caminho>/index@<parâmetros>, e as próximas páginas de cada feed ou listagem
+# são obtidas seguindo os links (ou o next_page) de cada página. Exemplo de
+# configuração do nginx:
+#
+#   location / {
+#       root /caminho/para/static;
+#       gzip_static on;
+#       brotli_static on;
+#       default_type application/json;
+#       try_files $uri/index@$args $uri/index @api;
+#   }
+#
+#   location /opds/ { ...; default_type application/atom+xml; }
+#   location /opds2/ { ...; default_type application/opds+json; }
+#   location = /rss { ...; default_type application/rss+xml; }
+#
+# Quando executado novamente, apenas as páginas afetadas pelos livros adicionados
+# ou alterados desde a última execução são geradas outra vez (use --full para
+# gerar tudo), e as páginas que deixaram de ser alcançadas (ex: com cursores de
+# uma versão anterior do acervo) são removidas. Um livro é considerado alterado
+# quando o seu JSON muda, o que inclui os dados das entidades relacionadas (ex: o
+# total_books do autor quando outro livro dele é adicionado).
+
+import argparse
+import asyncio
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import urllib.parse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A aplicação redireciona a saída padrão ao ser carregada. Os eventos de
+# inicialização (cópia do acervo, histórico de alterações e índice dos documentos
+# baixados) não são executados, de modo que os arquivos da API em execução não
+# são alterados.
+stdout = sys.stdout
+
+import application
+
+sys.stdout = stdout
+
+from config.feeds import opds2
+from config.limits import limits
+from utils.batch import execute_subrequest
+from utils.compression import AVAILABLE_ENCODINGS, compress
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument("--output", default="static", help="output directory")
+parser.add_argument("--full", action="store_true", help="render every page, even if nothing changed")
+
+options = parser.parse_args()
+
+# Extensões dos arquivos comprimidos de cada algoritmo
+EXTENSIONS = {"gzip": ".gz", "br": ".br"}
+
+# Coleções de entidades e o atributo correspondente de cada livro
+ENTITIES = [
+	("authors", "author"),
+	("artists", "artist"),
+	("narrators", "narrator"),
+	("publishers", "publisher"),
+	("categories", "category"),
+	("types", "type"),
+	("years", "year")
+]
+
+
+# Esta função retorna o arquivo em que a URL em questão é salva.
+def get_filename(path):
+	
+	url = urllib.parse.urlsplit(path)
+	filename = "index@" + url.query if url.query else "index"
+	
+	return os.path.join(options.output, url.path.strip("/"), filename)
+
+
+# Esta função retorna a URL da próxima página do feed ou da listagem em questão,
+# ou None caso essa seja a última página.
+def get_next_path(path, content_type, body):
+	
+	if content_type == "application/atom+xml":
+		match = re.search(rb'<link rel="next"\s+href="([^"]+)"', body)
+		
+		return html.unescape(match.group(1).decode("utf-8")) if match else None
+	
+	if content_type not in ("application/json", opds2.MEDIA_TYPE):
+		return None
+	
+	data = json.loads(body)
+	
+	if content_type == opds2.MEDIA_TYPE:
+		for link in data.get("links", []):
+			if link["rel"] == "next":
+				return link["href"]
+		
+		return None
+	
+	pagination = data.get("pagination") if isinstance(data, dict) else None
+	
+	if pagination is None or pagination["next_page"] is None:
+		return None
+	
+	return f"{urllib.parse.urlsplit(path).path}?page_number={pagination['next_page']}"
+
+
+# Esta função retorna as URLs que dependem de todo o acervo (páginas iniciais,
+# listagens de entidades, livros recentes e antigos e o feed RSS).
+def get_catalog_paths():
+	
+	paths = ["/opds", "/opds2", "/books", "/documents", "/covers", "/rss"]
+	
+	paths.extend(f"/rss?max_items={max_items}" for max_items in limits.RSS_BUCKETS)
+	
+	for prefix in ("/opds", "/opds2"):
+		paths.extend([f"{prefix}/recent-books", f"{prefix}/old-books"])
+		paths.extend(f"{prefix}/{collection}" for (collection, _) in ENTITIES)
+	
+	paths.extend(f"/{collection}" for (collection, _) in ENTITIES)
+	
+	return paths
+
+
+# Esta função retorna as URLs que dependem apenas do livro em questão e das
+# entidades relacionadas a ele.
+def get_book_paths(book):
+	
+	paths = [
+		f"/books/{book.id}",
+		f"/covers/{book.cover.id}",
+		f"/view/{book.cover.id}?meta=1"
+	]
+	
+	for document in book.documents:
+		paths.extend([f"/documents/{document.id}", f"/download/{document.id}?meta=1"])
+	
+	for (collection, attribute) in ENTITIES:
+		entity = getattr(book, attribute)
+		
+		if entity is not None:
+			paths.extend(
+				f"{prefix}/{collection}/{entity.id}" for prefix in ("/opds", "/opds2", "")
+			)
+	
+	return paths
+
+
+# Esta função salva o conteúdo em questão e as suas versões comprimidas.
+def write(path, body):
+	
+	filename = get_filename(path)
+	
+	os.makedirs(os.path.dirname(filename), exist_ok=True)
+	
+	with open(filename, mode="wb") as file:
+		file.write(body)
+	
+	for encoding in AVAILABLE_ENCODINGS:
+		if encoding in EXTENSIONS:
+			with open(filename + EXTENSIONS[encoding], mode="wb") as file:
+				file.write(compress(body, encoding))
+
+
+# Esta função remove o arquivo salvo para a URL em questão e as suas versões
+# comprimidas.
+def remove(path):
+	
+	filename = get_filename(path)
+	
+	for name in [filename] + [filename + extension for extension in EXTENSIONS.values()]:
+		if os.path.exists(name):
+			os.remove(name)
+
+
+# Esta função gera as URLs em questão (e as próximas páginas de cada uma). Retorna
+# as URLs alcançadas a partir de cada uma delas.
+async def export(paths, digests, full):
+	
+	(pages, written) = ({}, 0)
+	
+	for root in paths:
+		path = root
+		pages[root] = []
+		
+		while path is not None:
+			(status, content_type, body) = await execute_subrequest(application.app, {}, path, "*/*")
+			
+			if status != 200:
+				break
+			
+			pages[root].append(path)
+			
+			digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+			
+			if full or digests.get(path) != digest or not os.path.exists(get_filename(path)):
+				write(path, body)
+				digests[path] = digest
+				written += 1
+			
+			path = get_next_path(path, content_type, body)
+	
+	return (pages, written)
+
+
+manifest_filename = os.path.join(options.output, "manifest.json")
+
+manifest = {"api_version": None, "books": {}, "files": {}, "pages": {}}
+
+if os.path.exists(manifest_filename):
+	with open(manifest_filename, mode="r") as file:
+		manifest.update(json.load(file))
+
+# Versões anteriores do manifesto guardavam apenas as identificações dos livros.
+if isinstance(manifest["books"], list):
+	manifest["books"] = {}
+
+# Digest do JSON de cada livro (incluindo as entidades relacionadas)
+books_digests = {
+	str(book.id): hashlib.blake2b(
+		application.books_fragments.get(book.id), digest_size=16).hexdigest()
+	for book in application.books_list
+}
+
+# Quando o formato das páginas pode ter mudado, algum livro foi removido (ou com
+# --full), todas são geradas novamente, e os arquivos que não forem gerados outra
+# vez são removidos.
+full = (
+	options.full
+	or manifest["api_version"] != application.app.version
+	or not set(manifest["books"]) <= set(books_digests)
+)
+
+if full:
+	manifest.update({"api_version": application.app.version, "books": {}})
+
+changed_books = [
+	book for book in application.books_list
+	if manifest["books"].get(str(book.id)) != books_digests[str(book.id)]
+]
+
+paths = []
+
+if changed_books:
+	paths.extend(get_catalog_paths())
+	
+	for book in changed_books:
+		paths.extend(get_book_paths(book))
+
+# As páginas das entidades são compartilhadas por vários livros.
+paths = list(dict.fromkeys(paths))
+
+(pages, written) = asyncio.run(export(paths, manifest["files"], full))
+
+# As páginas que não são mais alcançadas (ex: as geradas para a versão anterior do
+# acervo, cujos cursores mudaram) são removidas, para que não sejam servidas.
+reached = {path for root_pages in pages.values() for path in root_pages}
+
+if full:
+	stale = set(manifest["files"]) - reached
+else:
+	stale = {
+		path for root in pages for path in manifest["pages"].get(root, [])
+	} - reached
+
+for path in stale:
+	remove(path)
+	manifest["files"].pop(path, None)
+
+if full:
+	manifest["pages"] = {}
+
+manifest["pages"].update(pages)
+
+manifest["books"] = books_digests
+
+os.makedirs(options.output, exist_ok=True)
+
+with open(manifest_filename, mode="w") as file:
+	json.dump(manifest, file)
+
+print(
+	f"{len(changed_books)} new or changed book(s), {len(reached)} page(s) rendered, "
+	f"{written} file(s) written and {len(stale)} removed from {options.output}"
+)
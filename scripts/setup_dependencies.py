@@ -47,6 +47,11 @@ command = [
 	"uvicorn",
 	"tgcrypto",
 	"aiofiles",
+	"brotli",
+	"zstandard",
+	"orjson",
+	"msgpack",
+	"cbor2",
 	"git+https://github.com/SnwMds/pyrogram#egg=Pyrogram",
 	"git+https://github.com/PolemicBooks/PlmcBks"
 ]
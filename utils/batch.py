@@ -0,0 +1,123 @@
+import asyncio
+import json
+import urllib.parse
+
+from pydantic import BaseModel, Field
+
+from config.batch import batch
+
+
+class Subrequest(BaseModel):
+	"""
+	Consulta a ser executada através do /batch. O caminho pode incluir os
+	parâmetros (ex: /books?max_items=5).
+	"""
+	
+	path: str = Field(..., title="Caminho", description="Caminho da consulta, incluindo os parâmetros", max_length=batch.MAX_PATH_LENGTH)
+
+
+# Esta função verifica se o caminho em questão pode ser consultado através do /batch.
+def is_allowed(path):
+	
+	path = urllib.parse.unquote(path)
+	
+	if not path.startswith("/") or "/../" in path + "/":
+		return False
+	
+	for allowed_path in batch.ALLOWED_PATHS:
+		if path == allowed_path or path.startswith(allowed_path + "/"):
+			return True
+	
+	return False
+
+
+# Esta função executa uma consulta diretamente na aplicação (sem uma nova conexão
+# HTTP), passando pelos mesmos middlewares e caches das demais requisições.
+# Retorna o status, o tipo de conteúdo e o conteúdo da resposta.
+async def execute_subrequest(app, scope, path, accept):
+	
+	url = urllib.parse.urlsplit(path)
+	
+	subscope = {
+		"type": "http",
+		"asgi": scope.get("asgi", {"version": "3.0"}),
+		"http_version": scope.get("http_version", "1.1"),
+		"scheme": scope.get("scheme", "http"),
+		"server": scope.get("server"),
+		"client": scope.get("client"),
+		"root_path": scope.get("root_path", ""),
+		"method": "GET",
+		"path": urllib.parse.unquote(url.path),
+		"raw_path": url.path.encode("latin-1", "ignore"),
+		"query_string": url.query.encode("latin-1", "ignore"),
+		"headers": [
+			(b"accept", accept.encode("latin-1")),
+			(b"accept-encoding", b"identity")
+		]
+	}
+	
+	async def receive():
+		return {"type": "http.request", "body": b"", "more_body": False}
+	
+	response = {"status": 500, "content_type": "", "body": []}
+	
+	async def send(message):
+		
+		if message["type"] == "http.response.start":
+			response["status"] = message["status"]
+			
+			for (name, value) in message.get("headers", []):
+				if name.lower() == b"content-type":
+					response["content_type"] = value.decode("latin-1").split(";")[0].strip()
+		elif message["type"] == "http.response.body":
+			response["body"].append(message.get("body", b""))
+	
+	await app(subscope, receive, send)
+	
+	return (response["status"], response["content_type"], b"".join(response["body"]))
+
+
+# Esta função executa as consultas em questão (em paralelo, já que todas são apenas
+# de leitura) e monta a resposta no formato solicitado pelo cliente, com os
+# resultados na mesma ordem das consultas.
+async def execute_batch(app, scope, subrequests, format):
+	
+	semaphore = asyncio.Semaphore(batch.MAX_CONCURRENCY)
+	
+	async def execute(subrequest):
+		
+		if not is_allowed(urllib.parse.urlsplit(subrequest.path).path):
+			return (400, format.media_type, format.dump({"error": "path is not allowed"}))
+		
+		async with semaphore:
+			try:
+				return await execute_subrequest(app, scope, subrequest.path, format.media_type)
+			except Exception:
+				return (500, format.media_type, format.dump({"error": "internal server error"}))
+	
+	results = await asyncio.gather(*[execute(subrequest) for subrequest in subrequests])
+	
+	items = []
+	
+	for (subrequest, (status_code, content_type, body)) in zip(subrequests, results):
+		
+		# Os erros de validação são sempre retornados em JSON.
+		if content_type != format.media_type:
+			if content_type == "application/json":
+				body = format.dump(json.loads(body))
+			else:
+				body = format.dump(None)
+		
+		items.append(
+			format.map_header(3)
+			+ format.pair("path", subrequest.path) + format.separator
+			+ format.pair("status", status_code) + format.separator
+			+ format.dump("body") + format.colon + body
+			+ format.map_footer
+		)
+	
+	return (
+		format.array_header(len(items))
+		+ format.separator.join(items)
+		+ format.array_footer
+	)
@@ -1,4 +1,9 @@
+import bisect
+import collections
 import datetime
+import threading
+import time
+import urllib.parse
 
 from .bytes import to_human
 
@@ -34,3 +39,215 @@ def create_caption(book):
 		caption += f"<strong>Visualizações</strong>: <em>{book.message_views}</em><br>"
 	
 	return caption
+
+
+# Esta função é usada para formatar datas no formato usado pelos cabeçalhos HTTP
+# e pelos feeds (RSS e OPDS).
+def format_date(timestamp):
+	return time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.localtime(timestamp))
+
+
+class BooksFormatting:
+	"""
+	Textos já formatados de cada livro (legenda, com a duração e o tamanho, e data
+	de envio), gerados uma única vez, em uma única passagem pelo acervo, e
+	reaproveitados por todos os feeds.
+	"""
+	
+	def __init__(self, books):
+		
+		self.captions = {}
+		self.dates = {}
+		
+		for book in books:
+			self.captions[book.id] = create_caption(book)
+			self.dates[book.id] = format_date(book.date)
+	
+	def get_caption(self, book):
+		
+		caption = self.captions.get(book.id)
+		
+		if caption is None:
+			caption = create_caption(book)
+			self.captions[book.id] = caption
+		
+		return caption
+	
+	def get_date(self, book):
+		
+		date = self.dates.get(book.id)
+		
+		if date is None:
+			date = format_date(book.date)
+			self.dates[book.id] = date
+		
+		return date
+
+
+class BooksIndex:
+	"""
+	Relaciona cada entidade (autor, categoria, editora etc.) à lista de identificações
+	dos livros ligados a ela. As listas são obtidas apenas uma vez por entidade.
+	"""
+	
+	def __init__(self, books):
+		
+		self.books = books
+		self.entities = {}
+	
+	def get(self, entity):
+		
+		books_ids = self.entities.get(entity.id)
+		
+		if books_ids is None:
+			books_ids = [book.id for book in entity.get_books(self.books)]
+			self.entities[entity.id] = books_ids
+		
+		return books_ids
+
+
+class BooksFacets:
+	"""
+	Facetas (tipo, ano, categoria etc.) dos feeds de livros. O valor de cada faceta
+	e a lista de livros de cada valor são obtidos uma única vez, durante o
+	carregamento do acervo.
+	
+	Uma lista filtrada é montada a partir da menor lista envolvida (a dos livros
+	de um dos valores ativos ou a própria lista do feed), de modo que o custo não
+	depende do tamanho do acervo. Cada lista filtrada é guardada junto da
+	quantidade de livros para cada valor das facetas; as menos usadas
+	recentemente são removidas primeiro. Valores inexistentes não são guardados.
+	"""
+	
+	def __init__(self, books, groups, max_entries):
+		
+		self.groups = groups
+		self.max_entries = max_entries
+		
+		self.values = {}
+		self.names = [{} for group in groups]
+		self.books = [collections.defaultdict(list) for group in groups]
+		
+		for book in books:
+			values = []
+			
+			for (index, (_, attribute, _)) in enumerate(groups):
+				entity = getattr(book, attribute)
+				
+				if entity is None:
+					values.append(None)
+				else:
+					values.append(entity.id)
+					self.names[index][entity.id] = entity.name
+					self.books[index][entity.id].append(book.id)
+			
+			self.values[book.id] = tuple(values)
+		
+		self.entries = collections.OrderedDict()
+		self.lock = threading.Lock()
+	
+	def is_valid(self, filters):
+		"""
+		Verifica se todos os valores informados em filters existem no acervo.
+		"""
+		
+		return all(
+			value is None or value in self.names[index]
+			for (index, value) in enumerate(filters)
+		)
+	
+	def filter(self, books_ids, filters):
+		"""
+		Retorna os livros da lista em questão (em ordem crescente) que possuem os
+		valores informados em filters.
+		"""
+		
+		if all(value is None for value in filters):
+			return books_ids
+		
+		candidates = min(
+			[self.books[index][value] for (index, value) in enumerate(filters) if value is not None],
+			key=len
+		)
+		
+		if len(books_ids) <= len(candidates):
+			candidates = books_ids
+		
+		results = []
+		
+		for book_id in candidates:
+			if not all(
+				value is None or value == book_value
+				for (value, book_value) in zip(filters, self.values[book_id])
+			):
+				continue
+			
+			if candidates is not books_ids:
+				position = bisect.bisect_left(books_ids, book_id)
+				
+				if position == len(books_ids) or books_ids[position] != book_id:
+					continue
+			
+			results.append(book_id)
+		
+		return results
+	
+	def get(self, key, books_ids, filters, reverse=False):
+		"""
+		Retorna os livros da lista em questão (identificada por key, em ordem
+		crescente) que possuem os valores informados em filters (None aceita
+		qualquer valor), em ordem inversa quando reverse é True, e a quantidade
+		desses livros para cada valor das facetas. Quando algum dos valores não
+		existe, retorna uma lista vazia.
+		"""
+		
+		if not self.is_valid(filters):
+			return ([], [collections.Counter() for group in self.groups])
+		
+		entry_key = (key, filters, reverse)
+		
+		with self.lock:
+			entry = self.entries.get(entry_key)
+			
+			if entry is not None:
+				self.entries.move_to_end(entry_key)
+				return entry
+		
+		results = self.filter(books_ids, filters)
+		
+		if reverse:
+			results = results[::-1]
+		
+		counts = [collections.Counter() for group in self.groups]
+		
+		for book_id in results:
+			for (index, value) in enumerate(self.values[book_id]):
+				if value is not None:
+					counts[index][value] += 1
+		
+		entry = (results, counts)
+		
+		with self.lock:
+			self.entries[entry_key] = entry
+			
+			if len(self.entries) > self.max_entries:
+				self.entries.popitem(last=False)
+		
+		return entry
+	
+	def create_query(self, filters, **parameters):
+		"""
+		Retorna os parâmetros da URL (query string) com as facetas ativas e os
+		demais parâmetros em questão (os que forem None são ignorados).
+		"""
+		
+		items = [
+			(parameter, value)
+			for ((parameter, _, _), value) in zip(self.groups, filters)
+			if value is not None
+		]
+		
+		items.extend(
+			(name, value) for (name, value) in parameters.items() if value is not None)
+		
+		return urllib.parse.urlencode(items)
@@ -0,0 +1,219 @@
+import collections
+import urllib.parse
+
+from .compression import get_header, negotiate_encoding
+from .negotiation import response_format
+
+
+# Esta função retorna o caminho da rota (ex: /authors/{author_id}) que atendeu à
+# requisição em questão, usado para agrupar as estatísticas do cache. Retorna None
+# quando nenhuma rota corresponde ao caminho (ex: 404).
+def get_route(scope):
+	return getattr(scope.get("route"), "path", None)
+
+
+class ResponseCache:
+	"""
+	Cache em memória de respostas completas (status, cabeçalhos e conteúdo),
+	limitado pelo total de bytes ocupados. As entradas menos usadas recentemente
+	são removidas primeiro, e todas são descartadas quando a versão do acervo muda.
+	"""
+	
+	def __init__(self, version, max_size, max_entry_size):
+		
+		self.version = version
+		self.max_size = max_size
+		self.max_entry_size = max_entry_size
+		
+		self.entries = collections.OrderedDict()
+		self.size = 0
+		
+		self.statistics = collections.defaultdict(lambda: [0, 0])
+	
+	def invalidate(self, version):
+		
+		if version == self.version:
+			return
+		
+		self.version = version
+		self.entries.clear()
+		self.size = 0
+	
+	def get(self, key):
+		
+		entry = self.entries.get(key)
+		
+		if entry is not None:
+			self.entries.move_to_end(key)
+		
+		return entry
+	
+	def record(self, route, hit):
+		"""
+		Contabiliza um acerto (ou uma falha) do cache na rota em questão.
+		"""
+		
+		self.statistics[route][0 if hit else 1] += 1
+	
+	def put(self, key, route, status, headers, body):
+		
+		size = len(body) + sum(len(name) + len(value) for (name, value) in headers)
+		
+		if size > self.max_entry_size:
+			return
+		
+		if key in self.entries:
+			self.size -= self.entries.pop(key)[3]
+		
+		self.entries[key] = (status, headers, body, size, route)
+		self.size += size
+		
+		while self.size > self.max_size:
+			(_, entry) = self.entries.popitem(last=False)
+			self.size -= entry[3]
+	
+	def get_statistics(self):
+		
+		routes = {}
+		
+		for (route, (hits, misses)) in sorted(self.statistics.items()):
+			routes[route] = {
+				"hits": hits,
+				"misses": misses,
+				"hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None
+			}
+		
+		return {
+			"version": self.version,
+			"entries": len(self.entries),
+			"size": self.size,
+			"max_size": self.max_size,
+			"routes": routes
+		}
+
+
+class ResponseCacheMiddleware:
+	"""
+	Responde às requisições GET usando as respostas guardadas no cache. Como o
+	acervo não muda enquanto a aplicação está em execução, a resposta de cada
+	endpoint depende apenas do caminho, dos parâmetros, da compressão aceita
+	pelo cliente e do formato das respostas (JSON, MessagePack ou CBOR).
+	"""
+	
+	def __init__(self, app, cache, excluded_paths=()):
+		
+		self.app = app
+		self.cache = cache
+		self.excluded_paths = tuple(excluded_paths)
+	
+	def is_cacheable(self, path):
+		
+		for excluded_path in self.excluded_paths:
+			if path == excluded_path or path.startswith(excluded_path + "/"):
+				return False
+		
+		return True
+	
+	async def __call__(self, scope, receive, send):
+		
+		if scope["type"] != "http" or scope["method"] != "GET" or not self.is_cacheable(scope["path"]):
+			await self.app(scope, receive, send)
+			return
+		
+		query = urllib.parse.urlencode(
+			sorted(urllib.parse.parse_qsl(
+				scope["query_string"].decode("latin-1"), keep_blank_values=True))
+		)
+		
+		encoding = negotiate_encoding(get_header(scope, b"accept-encoding"))
+		
+		key = (scope["path"], query, encoding, response_format.get().name)
+		entry = self.cache.get(key)
+		
+		if entry is not None:
+			(status, headers, body, _, route) = entry
+			
+			self.cache.record(route, hit=True)
+			
+			await send({"type": "http.response.start", "status": status, "headers": headers})
+			await send({"type": "http.response.body", "body": body})
+			return
+		
+		start_message = None
+		
+		async def send_and_store(message):
+			
+			nonlocal start_message
+			
+			if message["type"] == "http.response.start":
+				# Os cabeçalhos são copiados antes que os demais middlewares os alterem.
+				start_message = {"status": message["status"], "headers": list(message.get("headers", []))}
+			elif (
+				message["type"] == "http.response.body"
+				and start_message is not None
+				and start_message["status"] == 200
+				and not message.get("more_body", False)
+			):
+				self.cache.put(
+					key, get_route(scope), start_message["status"],
+					start_message["headers"], message.get("body", b""))
+			else:
+				# Respostas enviadas em partes não são guardadas.
+				start_message = None
+			
+			await send(message)
+		
+		await self.app(scope, receive, send_and_store)
+		
+		# Apenas as rotas existentes são contabilizadas, de modo que caminhos
+		# inválidos não ocupam memória nas estatísticas.
+		route = get_route(scope)
+		
+		if route is not None:
+			self.cache.record(route, hit=False)
+
+
+class CacheControlMiddleware:
+	"""
+	Adiciona o cabeçalho Cache-Control às respostas que não o definem. Os
+	endpoints cujo conteúdo muda enquanto a aplicação está em execução
+	(excluded_paths) recebem outro valor (ex: no-store), já que não devem ser
+	guardados pelos clientes nem pelos proxies.
+	"""
+	
+	def __init__(self, app, cache_control, excluded_cache_control, excluded_paths=()):
+		
+		self.app = app
+		self.cache_control = cache_control.encode("latin-1")
+		self.excluded_cache_control = excluded_cache_control.encode("latin-1")
+		self.excluded_paths = tuple(excluded_paths)
+	
+	def is_excluded(self, path):
+		
+		for excluded_path in self.excluded_paths:
+			if path == excluded_path or path.startswith(excluded_path + "/"):
+				return True
+		
+		return False
+	
+	async def __call__(self, scope, receive, send):
+		
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		
+		cache_control = self.excluded_cache_control if self.is_excluded(scope["path"]) else self.cache_control
+		
+		async def send_with_cache_control(message):
+			
+			if message["type"] == "http.response.start":
+				headers = list(message.get("headers", []))
+				
+				if not any(name.lower() == b"cache-control" for (name, _) in headers):
+					headers.append((b"cache-control", cache_control))
+				
+				message["headers"] = headers
+			
+			await send(message)
+		
+		await self.app(scope, receive, send_with_cache_control)
@@ -0,0 +1,148 @@
+import json
+import os
+import zlib
+
+
+# Esta função é usada para salvar um arquivo JSON de forma atômica.
+def write_json(path, data):
+	
+	temporary_path = path + ".tmp"
+	
+	with open(file=temporary_path, mode="w") as file:
+		json.dump(data, file, separators=(",", ":"))
+	
+	os.replace(temporary_path, path)
+
+
+# Esta função é usada para ler um arquivo JSON, caso ele exista.
+def read_json(path, default):
+	
+	try:
+		with open(file=path, mode="r") as file:
+			return json.load(file)
+	except (OSError, ValueError):
+		return default
+
+
+class Changelog:
+	"""
+	Histórico compacto de alterações do acervo. Para cada nova versão, são
+	guardadas apenas as identificações dos objetos adicionados, alterados e
+	removidos em relação à versão anterior.
+	
+	O estado da última versão (identificação e CRC32 do JSON de cada objeto) é
+	guardado em disco para que a comparação seja feita quando a aplicação for
+	iniciada com uma nova versão do acervo.
+	"""
+	
+	def __init__(self, directory, max_versions):
+		
+		self.directory = directory
+		self.max_versions = max_versions
+		
+		self.changelog_path = os.path.join(directory, "changelog.json")
+		self.state_path = os.path.join(directory, "state.json")
+		
+		self.versions = read_json(self.changelog_path, default=[])
+		self.version = None
+	
+	def update(self, version, collections):
+		
+		self.version = version
+		
+		state = read_json(self.state_path, default=None)
+		
+		if state is not None and state["version"] == version:
+			return
+		
+		digests = {}
+		
+		for (name, (fragments, objects_ids)) in collections.items():
+			digests[name] = {
+				"ids": objects_ids,
+				"digests": [zlib.crc32(fragments.get(object_id)) for object_id in objects_ids]
+			}
+		
+		if state is not None:
+			changes = {}
+			
+			for (name, current) in digests.items():
+				previous = state["collections"].get(name, {"ids": [], "digests": []})
+				
+				previous_digests = dict(zip(previous["ids"], previous["digests"]))
+				current_digests = dict(zip(current["ids"], current["digests"]))
+				
+				changes[name] = {
+					"added": [
+						object_id for object_id in current["ids"]
+						if object_id not in previous_digests
+					],
+					"changed": [
+						object_id for object_id in current["ids"]
+						if object_id in previous_digests
+						and previous_digests[object_id] != current_digests[object_id]
+					],
+					"removed": [
+						object_id for object_id in previous["ids"]
+						if object_id not in current_digests
+					]
+				}
+			
+			self.versions.append(
+				{"version": version, "previous": state["version"], "changes": changes})
+			
+			# Versões mais antigas são descartadas.
+			self.versions = self.versions[-self.max_versions:]
+		
+		os.makedirs(self.directory, exist_ok=True)
+		
+		write_json(self.changelog_path, self.versions)
+		write_json(self.state_path, {"version": version, "collections": digests})
+	
+	def get_changes(self, since):
+		"""
+		Retorna as alterações feitas desde a versão em questão, agrupadas por
+		coleção, ou None caso essa versão não esteja mais no histórico.
+		"""
+		
+		if since == self.version:
+			return {}
+		
+		for (index, entry) in enumerate(self.versions):
+			if entry["previous"] == since:
+				break
+		else:
+			return None
+		
+		# Estado final de cada objeto alterado: "added", "changed" ou "removed".
+		statuses = {}
+		
+		for entry in self.versions[index:]:
+			for (name, changes) in entry["changes"].items():
+				collection = statuses.setdefault(name, {})
+				
+				for object_id in changes["added"]:
+					if collection.get(object_id) == "removed":
+						collection[object_id] = "changed"
+					else:
+						collection[object_id] = "added"
+				
+				for object_id in changes["changed"]:
+					if collection.get(object_id) != "added":
+						collection[object_id] = "changed"
+				
+				for object_id in changes["removed"]:
+					if collection.get(object_id) == "added":
+						del collection[object_id]
+					else:
+						collection[object_id] = "removed"
+		
+		results = {}
+		
+		for (name, collection) in statuses.items():
+			results[name] = {"added": [], "changed": [], "removed": []}
+			
+			for (object_id, status) in sorted(collection.items()):
+				results[name][status].append(object_id)
+		
+		return results
@@ -0,0 +1,250 @@
+import zlib
+
+# Bibliotecas opcionais para compressão usando Brotli e Zstandard.
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+from config.compression import compression
+
+
+# Algoritmos de compressão disponíveis
+AVAILABLE_ENCODINGS = [
+	encoding for encoding in compression.ENCODINGS
+	if (encoding == "gzip")
+	or (encoding == "br" and brotli is not None)
+	or (encoding == "zstd" and zstandard is not None)
+]
+
+
+# Esta função é usada para escolher o algoritmo de compressão a partir do
+# cabeçalho Accept-Encoding enviado pelo cliente.
+def negotiate_encoding(accept_encoding):
+	
+	if not accept_encoding:
+		return None
+	
+	accepted = {}
+	
+	for item in accept_encoding.split(","):
+		(name, _, parameters) = item.strip().partition(";")
+		quality = 1.0
+		
+		if parameters.strip().startswith("q="):
+			try:
+				quality = float(parameters.strip()[2:])
+			except ValueError:
+				quality = 0.0
+		
+		accepted[name.strip().lower()] = quality
+	
+	for encoding in AVAILABLE_ENCODINGS:
+		quality = accepted.get(encoding, accepted.get("*", 0.0))
+		
+		if quality > 0:
+			return encoding
+	
+	return None
+
+
+# Esta função comprime um conteúdo completo usando o algoritmo em questão.
+def compress(data, encoding):
+	
+	if encoding == "br":
+		return brotli.compress(data, quality=compression.BROTLI_QUALITY)
+	
+	if encoding == "zstd":
+		return zstandard.ZstdCompressor(level=compression.ZSTD_LEVEL).compress(data)
+	
+	compressor = zlib.compressobj(compression.GZIP_LEVEL, zlib.DEFLATED, 31)
+	
+	return compressor.compress(data) + compressor.flush()
+
+
+class StreamCompressor:
+	"""
+	Comprime um conteúdo enviado em partes. Cada parte é liberada imediatamente
+	para que o cliente possa processá-la sem esperar pelo restante.
+	"""
+	
+	def __init__(self, encoding):
+		
+		self.encoding = encoding
+		
+		if encoding == "br":
+			self.compressor = brotli.Compressor(quality=compression.BROTLI_QUALITY)
+		elif encoding == "zstd":
+			self.compressor = zstandard.ZstdCompressor(
+				level=compression.ZSTD_LEVEL).compressobj()
+		else:
+			self.compressor = zlib.compressobj(
+				compression.GZIP_LEVEL, zlib.DEFLATED, 31)
+	
+	def compress(self, data):
+		
+		if self.encoding == "br":
+			return self.compressor.process(data) + self.compressor.flush()
+		
+		if self.encoding == "zstd":
+			return (
+				self.compressor.compress(data)
+				+ self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+			)
+		
+		return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+	
+	def finish(self):
+		
+		if self.encoding == "br":
+			return self.compressor.finish()
+		
+		return self.compressor.flush()
+
+
+# Esta função retorna o valor de um cabeçalho da requisição.
+def get_header(scope, name):
+	
+	for (key, value) in scope["headers"]:
+		if key == name:
+			return value.decode("latin-1")
+	
+	return None
+
+
+# Esta função verifica se um tipo de conteúdo é compressível (textual, MessagePack
+# ou CBOR). Os streams de eventos não são comprimidos, já que cada conexão
+# manteria um compressor em memória enquanto estivesse aberta.
+def is_compressible(content_type):
+	
+	content_type = content_type.split(";")[0].strip().lower()
+	
+	return (
+		(content_type.startswith("text/") and content_type != "text/event-stream")
+		or content_type.endswith("json")
+		or content_type.endswith("xml")
+		or content_type in ("application/msgpack", "application/cbor", "application/cbor-seq")
+	)
+
+
+class CompressionMiddleware:
+	"""
+	Comprime as respostas textuais usando gzip, Brotli ou Zstandard, de acordo
+	com o que o cliente aceita.
+	"""
+	
+	def __init__(self, app):
+		self.app = app
+	
+	async def __call__(self, scope, receive, send):
+		
+		if scope["type"] != "http" or scope["method"] not in ("GET", "POST"):
+			await self.app(scope, receive, send)
+			return
+		
+		encoding = negotiate_encoding(get_header(scope, b"accept-encoding"))
+		
+		if encoding is None:
+			await self.app(scope, receive, send)
+			return
+		
+		responder = CompressionResponder(send, encoding)
+		
+		await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+	
+	def __init__(self, send, encoding):
+		
+		self.original_send = send
+		self.encoding = encoding
+		
+		self.start_message = None
+		self.compressor = None
+		self.passthrough = False
+	
+	async def send(self, message):
+		
+		if message["type"] == "http.response.start":
+			headers = message.get("headers", [])
+			names = {name.lower(): value for (name, value) in headers}
+			
+			content_type = names.get(b"content-type", b"").decode("latin-1")
+			
+			# Respostas parciais e as que aceitam downloads parciais não são
+			# comprimidas, já que os intervalos (Content-Range) se referem ao
+			# conteúdo original.
+			if (
+				message["status"] != 200
+				or b"content-encoding" in names
+				or b"content-range" in names
+				or b"accept-ranges" in names
+				or not is_compressible(content_type)
+			):
+				self.passthrough = True
+				await self.original_send(message)
+			else:
+				self.start_message = message
+			
+			return
+		
+		if self.passthrough or message["type"] != "http.response.body":
+			await self.original_send(message)
+			return
+		
+		body = message.get("body", b"")
+		more_body = message.get("more_body", False)
+		
+		# Conteúdo completo
+		if self.compressor is None and not more_body:
+			message = self.start_message
+			
+			if len(body) < compression.MINIMUM_SIZE:
+				await self.original_send(message)
+				await self.original_send({"type": "http.response.body", "body": body})
+				return
+			
+			body = compress(body, self.encoding)
+			
+			message["headers"] = [
+				(name, value) for (name, value) in message.get("headers", [])
+				if name.lower() != b"content-length"
+			] + [
+				(b"content-encoding", self.encoding.encode("latin-1")),
+				(b"content-length", str(len(body)).encode("latin-1")),
+				(b"vary", b"Accept-Encoding")
+			]
+			
+			await self.original_send(message)
+			await self.original_send({"type": "http.response.body", "body": body})
+			return
+		
+		# Conteúdo enviado em partes
+		if self.compressor is None:
+			self.compressor = StreamCompressor(self.encoding)
+			
+			message = self.start_message
+			
+			message["headers"] = [
+				(name, value) for (name, value) in message.get("headers", [])
+				if name.lower() != b"content-length"
+			] + [
+				(b"content-encoding", self.encoding.encode("latin-1")),
+				(b"vary", b"Accept-Encoding")
+			]
+			
+			await self.original_send(message)
+		
+		data = self.compressor.compress(body) if body else b""
+		
+		if not more_body:
+			data += self.compressor.finish()
+		
+		await self.original_send(
+			{"type": "http.response.body", "body": data, "more_body": more_body})
@@ -0,0 +1,199 @@
+import collections
+import email.utils
+import hashlib
+import urllib.parse
+
+from .compression import get_header, negotiate_encoding
+from .negotiation import negotiate_format
+
+
+# Esta função é usada para gerar uma ETag forte a partir da versão do acervo,
+# do caminho e dos parâmetros (em ordem alfabética) da requisição.
+def create_etag(version, path, query_string):
+	
+	query = urllib.parse.urlencode(
+		sorted(urllib.parse.parse_qsl(query_string, keep_blank_values=True))
+	)
+	
+	digest = hashlib.blake2b(
+		f"{version}:{path}?{query}".encode("utf-8"), digest_size=12).hexdigest()
+	
+	return f'"{digest}"'
+
+
+# Esta função é usada para converter datas HTTP em timestamps.
+def parse_http_date(value):
+	
+	try:
+		return email.utils.mktime_tz(email.utils.parsedate_tz(value))
+	except (TypeError, ValueError, OverflowError):
+		return None
+
+
+# Cabeçalhos mantidos nas respostas 304 (Not Modified)
+NOT_MODIFIED_HEADERS = (b"etag", b"last-modified", b"vary", b"cache-control", b"content-location", b"expires")
+
+
+# Esta função verifica se alguma das ETags do cabeçalho If-None-Match (ou "*")
+# corresponde à ETag em questão.
+def match_etag(if_none_match, etag):
+	
+	for tag in if_none_match.split(","):
+		tag = tag.strip()
+		
+		if tag.startswith("W/"):
+			tag = tag[2:]
+		
+		if tag == "*" or tag == etag:
+			return True
+	
+	return False
+
+
+# Esta função verifica se o cliente já possui a versão atual do conteúdo (com a
+# ETag e a data de modificação em questão), a partir dos cabeçalhos If-None-Match
+# e If-Modified-Since (ignorado quando o primeiro é informado).
+def is_not_modified(if_none_match, if_modified_since, etag, last_modified):
+	
+	if if_none_match is not None:
+		return etag is not None and match_etag(if_none_match, etag)
+	
+	if if_modified_since is not None and last_modified is not None:
+		timestamp = parse_http_date(if_modified_since)
+		last_modified = parse_http_date(last_modified)
+		
+		return timestamp is not None and last_modified is not None and timestamp >= last_modified
+	
+	return False
+
+
+class ConditionalRequestMiddleware:
+	"""
+	Adiciona os cabeçalhos ETag e Last-Modified às respostas e responde com
+	304 (Not Modified) às requisições condicionais. Como o acervo não muda
+	enquanto a aplicação está em execução, o conteúdo de cada endpoint depende
+	apenas da versão do acervo, do caminho e dos parâmetros. Os endpoints cujo
+	conteúdo muda mesmo assim (excluded_paths) não são alterados.
+	
+	Os cabeçalhos de validação (ETag, Last-Modified, Vary etc.) de cada resposta
+	200 são guardados para a variante correspondente (caminho, parâmetros,
+	formato e compressão aceita pelo cliente). Quando eles já são conhecidos, a
+	resposta 304 é enviada com esses mesmos cabeçalhos, sem que o endpoint seja
+	executado. Do contrário, o endpoint é executado e apenas uma resposta 200 é
+	convertida em 304; as demais (ex: 404) são enviadas normalmente. As variantes
+	menos usadas recentemente são removidas primeiro.
+	"""
+	
+	def __init__(self, app, version, last_modified, excluded_paths=(), max_entries=16384):
+		
+		self.app = app
+		self.version = version
+		self.last_modified = last_modified
+		
+		self.excluded_paths = tuple(excluded_paths)
+		
+		self.validators = collections.OrderedDict()
+		self.max_entries = max_entries
+	
+	def is_versioned(self, path):
+		
+		for excluded_path in self.excluded_paths:
+			if path == excluded_path or path.startswith(excluded_path + "/"):
+				return False
+		
+		return True
+	
+	async def __call__(self, scope, receive, send):
+		
+		if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or not self.is_versioned(scope["path"]):
+			await self.app(scope, receive, send)
+			return
+		
+		query_string = scope["query_string"].decode("latin-1")
+		
+		# Cada formato (JSON, MessagePack ou CBOR) possui uma ETag própria.
+		format = negotiate_format(get_header(scope, b"accept"))
+		version = self.version if format.name == "json" else f"{self.version}:{format.name}"
+		
+		etag = create_etag(version, scope["path"], query_string)
+		
+		key = (
+			scope["path"],
+			query_string,
+			format.name,
+			negotiate_encoding(get_header(scope, b"accept-encoding"))
+		)
+		
+		if_none_match = get_header(scope, b"if-none-match")
+		if_modified_since = get_header(scope, b"if-modified-since")
+		
+		conditional = if_none_match is not None or if_modified_since is not None
+		
+		validators = self.validators.get(key) if conditional else None
+		
+		if validators is not None:
+			self.validators.move_to_end(key)
+			
+			names = {name: value.decode("latin-1") for (name, value) in validators}
+			
+			if is_not_modified(
+				if_none_match, if_modified_since, names.get(b"etag"), names.get(b"last-modified")
+			):
+				await send({"type": "http.response.start", "status": 304, "headers": validators})
+				await send({"type": "http.response.body", "body": b""})
+				return
+		
+		not_modified = False
+		
+		async def send_with_validators(message):
+			
+			nonlocal not_modified
+			
+			if message["type"] == "http.response.start" and message["status"] == 200:
+				headers = list(message.get("headers", []))
+				names = {name.lower(): value for (name, value) in headers}
+				
+				if b"etag" not in names:
+					# Cada variante comprimida precisa de uma ETag própria.
+					if b"content-encoding" in names:
+						encoding = names[b"content-encoding"].decode("latin-1")
+						names[b"etag"] = f'{etag[:-1]}-{encoding}"'.encode("latin-1")
+					else:
+						names[b"etag"] = etag.encode("latin-1")
+					
+					headers.append((b"etag", names[b"etag"]))
+				if b"last-modified" not in names:
+					names[b"last-modified"] = self.last_modified.encode("latin-1")
+					headers.append((b"last-modified", names[b"last-modified"]))
+				
+				message["headers"] = headers
+				
+				validators = [
+					(name.lower(), value) for (name, value) in headers
+					if name.lower() in NOT_MODIFIED_HEADERS
+				]
+				
+				self.validators[key] = validators
+				
+				if len(self.validators) > self.max_entries:
+					self.validators.popitem(last=False)
+				
+				if conditional and is_not_modified(
+					if_none_match,
+					if_modified_since,
+					names[b"etag"].decode("latin-1"),
+					names[b"last-modified"].decode("latin-1")
+				):
+					not_modified = True
+					
+					message = {"type": "http.response.start", "status": 304, "headers": validators}
+			elif not_modified and message["type"] == "http.response.body":
+				# O conteúdo não é enviado nas respostas 304.
+				if message.get("more_body", False):
+					return
+				
+				message = {"type": "http.response.body", "body": b""}
+			
+			await send(message)
+		
+		await self.app(scope, receive, send_with_validators)
@@ -0,0 +1,194 @@
+import collections
+import glob
+import json
+import os
+import threading
+
+import anyio
+
+
+class DownloadsCache:
+	"""
+	Cache em disco dos documentos baixados do Telegram, limitado pelo total de
+	bytes ocupados. Os documentos usados há mais tempo são removidos primeiro.
+	
+	Cada documento é identificado pela sua identificação e pela da mensagem em que
+	ele foi enviado (que muda caso o arquivo seja substituído) e é gravado primeiro
+	em um arquivo temporário, que só é renomeado depois que o download termina, de
+	modo que um download interrompido nunca é servido. A gravação é feita fora do
+	loop de eventos.
+	
+	O índice (documentos e tamanhos, do usado há mais tempo ao usado mais
+	recentemente) é guardado junto dos documentos e carregado novamente por load()
+	quando a aplicação é iniciada.
+	"""
+	
+	def __init__(self, directory, max_size, max_file_size):
+		
+		self.directory = directory
+		self.max_size = max_size
+		self.max_file_size = max_file_size
+		
+		self.index_path = os.path.join(directory, "index.json")
+		
+		self.entries = collections.OrderedDict()
+		self.size = 0
+		
+		# Documentos sendo gravados no momento
+		self.writing = set()
+		
+		self.lock = threading.Lock()
+		self.save_lock = threading.Lock()
+	
+	def get_path(self, key):
+		return os.path.join(self.directory, key)
+	
+	def load(self):
+		
+		os.makedirs(self.directory, exist_ok=True)
+		
+		entries = []
+		
+		if os.path.exists(self.index_path):
+			try:
+				with open(file=self.index_path, mode="r") as file:
+					entries = json.load(file)
+			except ValueError:
+				entries = []
+		
+		for (key, size) in entries:
+			path = self.get_path(key)
+			
+			if os.path.exists(path) and os.path.getsize(path) == size:
+				self.entries[key] = size
+				self.size += size
+		
+		# Arquivos temporários de downloads interrompidos e documentos que não
+		# constam no índice não são mais necessários.
+		for path in glob.glob(os.path.join(self.directory, "*")):
+			name = os.path.basename(path)
+			
+			if path != self.index_path and name not in self.entries:
+				os.remove(path)
+		
+		self.evict(0)
+		self.save(list(self.entries.items()))
+	
+	def save(self, entries):
+		
+		temporary_path = self.index_path + ".tmp"
+		
+		with self.save_lock:
+			with open(file=temporary_path, mode="w") as file:
+				json.dump(entries, file)
+			
+			os.replace(temporary_path, self.index_path)
+	
+	def evict(self, size):
+		"""
+		Remove os documentos usados há mais tempo até que haja espaço para um
+		documento com o tamanho em questão.
+		"""
+		
+		while self.entries and self.size + size > self.max_size:
+			(key, entry_size) = self.entries.popitem(last=False)
+			self.size -= entry_size
+			
+			try:
+				os.remove(self.get_path(key))
+			except FileNotFoundError:
+				pass
+	
+	def open(self, key):
+		"""
+		Retorna o documento em questão já aberto, ou None caso ele não esteja
+		guardado. Como o arquivo é aberto enquanto o índice está bloqueado, ele
+		continua disponível mesmo que seja removido por outro download logo depois.
+		"""
+		
+		with self.lock:
+			if key not in self.entries:
+				return None
+			
+			try:
+				file = open(file=self.get_path(key), mode="rb")
+			except FileNotFoundError:
+				self.size -= self.entries.pop(key)
+				return None
+			
+			self.entries.move_to_end(key)
+		
+		return file
+	
+	def put(self, key, temporary_path, size):
+		
+		with self.lock:
+			self.evict(size)
+			
+			os.replace(temporary_path, self.get_path(key))
+			
+			self.entries[key] = size
+			self.size += size
+			
+			entries = list(self.entries.items())
+		
+		self.save(entries)
+	
+	async def store(self, key, content, size):
+		"""
+		Repassa as partes do documento em questão (vindas do Telegram), gravando-as
+		em disco ao mesmo tempo. O documento só é guardado quando todas as partes
+		foram recebidas.
+		"""
+		
+		with self.lock:
+			cacheable = size <= self.max_file_size and key not in self.writing
+			
+			if cacheable:
+				self.writing.add(key)
+		
+		if not cacheable:
+			async for chunk in content:
+				yield chunk
+			
+			return
+		
+		temporary_path = self.get_path(key) + ".tmp"
+		
+		file = None
+		written = 0
+		
+		try:
+			try:
+				file = await anyio.to_thread.run_sync(open, temporary_path, "wb")
+			except OSError:
+				pass
+			
+			async for chunk in content:
+				if file is not None:
+					try:
+						await anyio.to_thread.run_sync(file.write, chunk)
+						written += len(chunk)
+					except OSError:
+						# Sem espaço em disco, por exemplo. O download continua
+						# normalmente, mas o documento não é guardado.
+						file.close()
+						file = None
+				
+				yield chunk
+			
+			if file is not None:
+				file.close()
+				file = None
+				
+				if written == size:
+					await anyio.to_thread.run_sync(self.put, key, temporary_path, size)
+		finally:
+			if file is not None:
+				file.close()
+			
+			if os.path.exists(temporary_path):
+				os.remove(temporary_path)
+			
+			with self.lock:
+				self.writing.discard(key)
@@ -0,0 +1,79 @@
+import asyncio
+import bisect
+
+from config.events import events
+
+
+class BooksEvents:
+	"""
+	Notificações (Server-Sent Events) dos livros adicionados ao acervo. A
+	identificação de cada evento é a identificação do livro, de modo que o cliente
+	pode retomar a conexão (cabeçalho Last-Event-ID) e receber apenas os livros
+	adicionados depois do último recebido, inclusive após a aplicação ter sido
+	reiniciada com uma nova versão do acervo.
+	
+	Todas as conexões esperam pelo mesmo asyncio.Event, que é substituído a cada
+	publicação, de modo que conexões ociosas custam apenas uma espera no loop.
+	"""
+	
+	def __init__(self, fragments, books_ids):
+		
+		self.fragments = fragments
+		self.books_ids = sorted(books_ids)
+		
+		self.connections = 0
+		self.event = asyncio.Event()
+	
+	def is_full(self):
+		return self.connections >= events.MAX_CONNECTIONS
+	
+	def publish(self, books_ids):
+		"""
+		Adiciona os livros em questão e notifica as conexões abertas. Deve ser
+		chamado a partir do loop (asyncio) da aplicação.
+		"""
+		
+		for book_id in books_ids:
+			position = bisect.bisect_left(self.books_ids, book_id)
+			
+			if position == len(self.books_ids) or self.books_ids[position] != book_id:
+				self.books_ids.insert(position, book_id)
+		
+		(event, self.event) = (self.event, asyncio.Event())
+		event.set()
+	
+	def create_event(self, book_id):
+		return b"id: %d\nevent: book\ndata: %s\n\n" % (book_id, self.fragments.get(book_id))
+	
+	async def stream(self, last_event_id=None):
+		"""
+		Retorna os eventos dos livros adicionados depois de last_event_id (ou, caso
+		ele não tenha sido informado, dos livros adicionados a partir de agora).
+		"""
+		
+		self.connections += 1
+		
+		try:
+			yield b"retry: %d\n\n" % events.RETRY_INTERVAL
+			
+			if last_event_id is None:
+				last_event_id = self.books_ids[-1] if self.books_ids else -1
+			
+			while True:
+				position = bisect.bisect_right(self.books_ids, last_event_id)
+				position = max(position, len(self.books_ids) - events.MAX_RESUME_EVENTS)
+				
+				while position < len(self.books_ids):
+					books_ids = self.books_ids[position:position + events.CHUNK_EVENTS]
+					
+					yield b"".join(self.create_event(book_id) for book_id in books_ids)
+					
+					last_event_id = books_ids[-1]
+					position += len(books_ids)
+				
+				try:
+					await asyncio.wait_for(self.event.wait(), timeout=events.HEARTBEAT_INTERVAL)
+				except asyncio.TimeoutError:
+					yield b": heartbeat\n\n"
+		finally:
+			self.connections -= 1
@@ -0,0 +1,138 @@
+import bisect
+import glob
+import gzip
+import logging
+import os
+import tempfile
+
+# Biblioteca opcional para compressão usando Zstandard. Sem ela, o gzip é usado.
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+from config.exports import exports
+
+from .serialization import dump_json
+
+logger = logging.getLogger("uvicorn.error")
+
+
+# Esta função é usada para gerar o conteúdo de uma exportação no formato NDJSON
+# (um objeto JSON por linha) ou, para os formatos binários, como uma sequência de
+# objetos concatenados. Os objetos são enviados em blocos, de modo que o uso de
+# memória não depende do tamanho do acervo.
+def stream_ndjson(fragments, objects_ids, after_id=None, chunk_size=1000):
+	
+	separator = fragments.format.sequence_separator
+	
+	start = 0 if after_id is None else bisect.bisect_right(objects_ids, after_id)
+	
+	for index in range(start, len(objects_ids), chunk_size):
+		yield fragments.join(objects_ids[index:index + chunk_size], separator=separator) + separator
+
+
+class Snapshot:
+	"""
+	Cópia completa do acervo em um único arquivo comprimido (NDJSON), gerada uma
+	única vez para cada versão do acervo e guardada em disco.
+	
+	A primeira linha contém a versão do acervo; as demais contêm um objeto cada,
+	no formato {"collection": ..., "item": ...}.
+	"""
+	
+	def __init__(self, directory, version, collections, chunk_size=1000):
+		
+		self.directory = directory
+		self.version = version
+		self.collections = collections
+		self.chunk_size = chunk_size
+		
+		if zstandard is not None:
+			(self.extension, self.media_type) = ("zst", "application/zstd")
+		else:
+			(self.extension, self.media_type) = ("gz", "application/gzip")
+		
+		self.filename = f"catalog-{version}.ndjson.{self.extension}"
+		self.path = os.path.join(directory, self.filename)
+		
+		self.ready = os.path.exists(self.path)
+		self.building = False
+	
+	def start(self, loop):
+		"""
+		Gera a cópia em segundo plano, caso ela ainda não exista nem esteja sendo
+		gerada. Caso a geração falhe (ex: sem espaço em disco), o erro é registrado
+		e a cópia é gerada novamente na próxima chamada.
+		"""
+		
+		# A cópia pode ter sido gerada por outro processo.
+		self.ready = self.ready or os.path.exists(self.path)
+		
+		if self.ready or self.building:
+			return
+		
+		self.building = True
+		
+		future = loop.run_in_executor(None, self.build)
+		future.add_done_callback(self.finish)
+	
+	def finish(self, future):
+		
+		self.building = False
+		
+		if not future.cancelled() and future.exception() is not None:
+			logger.error("snapshot %s could not be generated", self.filename, exc_info=future.exception())
+	
+	def open_writer(self, file):
+		
+		if zstandard is not None:
+			return zstandard.ZstdCompressor(
+				level=exports.SNAPSHOT_ZSTD_LEVEL, threads=-1).stream_writer(file)
+		
+		return gzip.GzipFile(fileobj=file, mode="wb", compresslevel=exports.SNAPSHOT_GZIP_LEVEL)
+	
+	def build(self):
+		
+		if self.ready:
+			return
+		
+		os.makedirs(self.directory, exist_ok=True)
+		
+		# Cada processo usa um arquivo temporário próprio, de modo que vários
+		# processos podem gerar a mesma cópia ao mesmo tempo.
+		(descriptor, temporary_path) = tempfile.mkstemp(
+			dir=self.directory, prefix=self.filename + ".", suffix=".tmp")
+		
+		try:
+			with os.fdopen(descriptor, mode="wb") as file:
+				self.write(file)
+			
+			os.replace(temporary_path, self.path)
+		except BaseException:
+			os.remove(temporary_path)
+			raise
+		
+		# Cópias de versões anteriores não são mais necessárias (os arquivos
+		# temporários pertencem a gerações ainda em andamento).
+		for path in glob.glob(os.path.join(self.directory, "catalog-*.ndjson.*")):
+			if path != self.path and not path.endswith(".tmp"):
+				os.remove(path)
+		
+		self.ready = True
+	
+	def write(self, file):
+		
+		writer = self.open_writer(file)
+		writer.write(dump_json({"version": self.version}) + b"\n")
+		
+		for (name, (fragments, objects_ids)) in self.collections.items():
+			prefix = b'{"collection":' + dump_json(name) + b',"item":'
+			
+			for index in range(0, len(objects_ids), self.chunk_size):
+				writer.write(b"".join(
+					prefix + fragments.get(object_id) + b"}\n"
+					for object_id in objects_ids[index:index + self.chunk_size]
+				))
+		
+		writer.close()
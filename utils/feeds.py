@@ -0,0 +1,424 @@
+import collections
+import html
+import threading
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+from config.compression import compression
+from config.feeds import opds, rss
+from config.limits import limits
+from config.urls import urls
+
+from .compression import compress
+
+# Início e fim do feed RSS (antes e depois dos itens)
+(RSS_HEADER, RSS_FOOTER) = rss.BASE.split("{}", 1)
+
+# Início (com o título, a descrição e o caminho) e fim do feed RSS das entidades
+(RSS_ENTITY_HEADER, RSS_ENTITY_FOOTER) = rss.ENTITY_BASE.rsplit("{}", 1)
+
+
+class OPDSEntries:
+	"""
+	Entradas (<entry>) dos livros nos feeds OPDS. Cada entrada é gerada uma única
+	vez (por versão do acervo) e reaproveitada por todos os feeds.
+	
+	A única parte da entrada que depende da página (o page_number do link do autor)
+	é preenchida no momento em que o feed é montado.
+	"""
+	
+	def __init__(self, books, formatting):
+		
+		self.books = books
+		self.formatting = formatting
+		self.entries = {}
+	
+	def render(self, book):
+		"""
+		Retorna a entrada do livro em questão, dividida em duas partes: antes e
+		depois do page_number do link do autor (None quando o livro não possui autor).
+		"""
+		
+		document = book.documents[0]
+		
+		updated = self.formatting.get_date(book)
+		
+		head = (
+			f"<entry>\n  <title>{html.escape(book.title) if book.title is not None else 'Unknown'}</title>"
+			f"\n  <id>book:{book.id}</id>"
+			f"\n  <updated>{updated}</updated>"
+			f'\n  <link rel="http://opds-spec.org/image"\n		href="/view/{book.cover.id}"\n		type="{book.cover.mime_type}"/>'
+			f'\n  <link rel="http://opds-spec.org/acquisition"\n		href="/download/{document.id}"\n		type="{document.mime_type}"/>'
+		)
+		
+		tail = ""
+		
+		if book.author is not None:
+			head += f"\n  <author>\n	<name>{html.escape(book.author.name)}</name>\n	<uri>/opds/authors/{book.author.id}?page_number="
+			tail += "</uri>\n  </author>"
+		
+		tail += "\n  <dc:language>pt</dc:language>"
+		
+		if book.publisher is not None:
+			tail += f"\n  <dc:publisher>{html.escape(book.publisher.name)}</dc:publisher>"
+		if book.year is not None:
+			tail += f"\n  <dc:issued>{book.year.name}</dc:issued>"
+		if book.category is not None:
+			tail += f'\n  <category scheme="http://www.bisg.org/standards/bisac_subject/index.html"\n		term="{book.category.id}"\n		label="{html.escape(book.category.name)}"/>'
+		if book.type is not None:
+			tail += f"\n  <summary>{book.type.name}</summary>"
+		
+		filename = (
+			book.title + "." + document.file_extension
+			if book.title is not None else "document." + document.file_extension
+		)
+		
+		tail += f'<content type="xhtml">{html.escape(self.formatting.get_caption(book))}'
+		tail += html.escape(f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(document.id)}">{filename}</a></em>')
+		tail += "</content>\n</entry>"
+		
+		if book.author is None:
+			return (head + tail, None)
+		
+		return (head, tail)
+	
+	def get(self, book_id):
+		
+		entry = self.entries.get(book_id)
+		
+		if entry is None:
+			entry = self.render(self.books.get(book_id))
+			self.entries[book_id] = entry
+		
+		return entry
+	
+	def join(self, books_ids, page_number):
+		"""
+		Retorna as entradas dos livros em questão, já com o page_number preenchido.
+		"""
+		
+		page_number = str(page_number)
+		parts = []
+		
+		for book_id in books_ids:
+			(head, tail) = self.get(book_id)
+			
+			if tail is None:
+				parts.append(head)
+			else:
+				parts.extend((head, page_number, tail))
+		
+		return "".join(parts)
+	
+	def iter(self, books_ids, page_number, chunk_items=limits.FEED_CHUNK_ITEMS):
+		"""
+		Retorna as entradas dos livros em questão em blocos, para que feeds grandes
+		possam ser enviados aos poucos.
+		"""
+		
+		for index in range(0, len(books_ids), chunk_items):
+			yield self.join(books_ids[index:index + chunk_items], page_number)
+
+
+# Esta função é usada para montar um feed OPDS a partir do cabeçalho (título, data,
+# imagem e descrição), dos links para a página atual e para a próxima página,
+# dos links de facetas e das entradas já geradas. O feed é gerado em partes.
+def create_opds_feed(title, updated, image, subtitle, self_href, next_href, entries, facets=""):
+	
+	feed = opds.BASE.format(title, updated, image, subtitle) + opds.SELF_BASE.format(self_href)
+	
+	if next_href is not None:
+		feed += opds.NEXT_PAGE_BASE.format(next_href)
+	
+	yield feed + facets
+	yield from entries
+	yield "</feed>"
+
+
+# Esta função é usada para gerar os links de facetas (opds:facet) de um feed de
+# livros, a partir das contagens já calculadas. Cada link mantém as demais facetas
+# ativas (e os parâmetros em questão); o link de uma faceta ativa a remove.
+#
+# As facetas de ordenação (sorts) são informadas como (título, caminho,
+# parâmetros, ativa) e contam todos os livros do feed (total_items). Os grupos
+# em excluded (ex: a categoria, no feed de uma categoria) não são incluídos.
+def create_opds_facets(facets, href, filters, counts, total_items, sorts, excluded=(), **parameters):
+	
+	links = []
+	
+	for (index, (parameter, _, group)) in enumerate(facets.groups):
+		if parameter in excluded:
+			continue
+		
+		for (value, count) in sorted(counts[index].items()):
+			active = filters[index] == value
+			
+			query = facets.create_query(
+				filters[:index] + (None if active else value,) + filters[index + 1:], **parameters)
+			
+			links.append(
+				opds.FACET_BASE.format(
+					html.escape(f"{href}?{query}"),
+					html.escape(str(facets.names[index][value])),
+					group,
+					"true" if active else "false",
+					count
+				)
+			)
+	
+	for (title, sort_href, sort_parameters, active) in sorts:
+		query = facets.create_query(filters, **{**parameters, **sort_parameters})
+		
+		links.append(
+			opds.FACET_BASE.format(
+				html.escape(f"{sort_href}?{query}"),
+				title,
+				opds.SORT_FACET_GROUP,
+				"true" if active else "false",
+				total_items
+			)
+		)
+	
+	return "".join(links)
+
+
+# Esta função é usada para gerar o item de um livro no feed RSS.
+def render_rss_item(book, formatting):
+	
+	document = book.documents[0]
+	
+	filename = (
+		book.title + "." + document.file_extension
+		if book.title is not None else "document." + document.file_extension
+	)
+	
+	return rss.ITEM_BASE.format(
+		html.escape(book.title) if book.title is not None else "Unknown",
+		urls.PRIVATE_CHAT_URL + '/' + str(book.message_id),
+		urls.PRIVATE_CHAT_URL + '/' + str(book.message_id),
+		urls.API_URL + "/download/" + str(document.message_id), document.file_size, document.mime_type,
+		html.escape("plmcbks@pm.me (Polemic Books)"),
+		formatting.get_date(book),
+		html.escape(
+			"<p>"
+			+ f'<img src="{urls.API_URL + "/view/" + str(book.cover.id)}" width="{book.cover.resolution.width}" height="{book.cover.resolution.height}" referrerpolicy="no-referrer">'
+			+ formatting.get_caption(book)
+			+ f'<strong>Download</strong>: <em><a href="{urls.API_URL + "/download/" + str(document.id)}">{filename}</a></em>'
+			"</p>"
+		)
+	)
+
+
+class RSSItems:
+	"""
+	Itens (<item>) dos livros nos feeds RSS. Cada item é gerado uma única vez e
+	reaproveitado por todos os feeds.
+	
+	Os feeds dos livros adicionados recentemente com as quantidades de itens mais
+	usadas (buckets) são montados e comprimidos com antecedência, de modo que essas
+	requisições não precisam gerar nem comprimir nada. Os feeds de cada entidade
+	(autor, categoria etc.) com essas mesmas quantidades de itens são montados
+	quando solicitados pela primeira vez e guardados, limitados pelo total de bytes
+	ocupados (os menos usados recentemente são removidos primeiro). Com as demais
+	quantidades, eles são montados a cada requisição.
+	
+	Quando a versão do acervo muda, apenas os itens dos livros novos são gerados;
+	os demais são reaproveitados.
+	"""
+	
+	def __init__(self, books, formatting, max_items, buckets, encodings, max_size):
+		
+		self.books = books
+		self.formatting = formatting
+		self.max_items = max_items
+		self.buckets = buckets
+		self.encodings = encodings
+		self.max_size = max_size
+		
+		self.version = None
+		self.items = {}
+		
+		self.content = ""
+		self.offsets = [0]
+		self.bodies = {}
+		
+		self.feeds = collections.OrderedDict()
+		self.size = 0
+		self.lock = threading.Lock()
+	
+	def get_item(self, book):
+		
+		item = self.items.get(book.id)
+		
+		if item is None:
+			item = render_rss_item(book, self.formatting)
+			self.items[book.id] = item
+		
+		return item
+	
+	def update(self, version, books):
+		"""
+		Atualiza os itens a partir dos livros do acervo (em ordem crescente).
+		"""
+		
+		if version == self.version:
+			return
+		
+		items = [self.get_item(book) for book in reversed(books[-self.max_items:])]
+		
+		offsets = [0]
+		
+		for item in items:
+			offsets.append(offsets[-1] + len(item))
+		
+		self.content = "".join(items)
+		self.offsets = offsets
+		
+		bodies = {}
+		
+		for bucket in self.buckets:
+			body = "".join(self.iter(bucket)).encode("utf-8")
+			
+			bodies[bucket] = {None: body}
+			
+			for encoding in self.encodings:
+				bodies[bucket][encoding] = compress(body, encoding)
+		
+		self.bodies = bodies
+		
+		with self.lock:
+			self.feeds.clear()
+			self.size = 0
+		
+		self.version = version
+	
+	def store_feed(self, feed_key, variants, encoding, body):
+		"""
+		Guarda uma variante (sem compressão ou comprimida) do feed em questão,
+		removendo os feeds usados há mais tempo até que o total de bytes ocupados
+		volte ao limite.
+		"""
+		
+		with self.lock:
+			if self.feeds.get(feed_key) is not variants:
+				if encoding is not None or len(body) > self.max_size:
+					return
+				
+				# O mesmo feed pode ter sido montado ao mesmo tempo por outra requisição.
+				previous = self.feeds.pop(feed_key, None)
+				
+				if previous is not None:
+					self.size -= sum(len(variant) for variant in previous.values())
+				
+				self.feeds[feed_key] = variants
+			
+			variants[encoding] = body
+			self.size += len(body)
+			
+			while self.size > self.max_size:
+				(_, evicted) = self.feeds.popitem(last=False)
+				self.size -= sum(len(variant) for variant in evicted.values())
+	
+	def get_feed(self, key, title, description, href, books_ids, max_items, encoding=None):
+		"""
+		Retorna o feed com os livros mais recentes da lista em questão (em ordem
+		crescente), identificado por key, junto do algoritmo de compressão usado.
+		Retorna None quando a quantidade de itens não é uma das guardadas
+		(buckets); nesse caso, o feed deve ser montado por iter_feed().
+		"""
+		
+		if max_items not in self.buckets:
+			return None
+		
+		feed_key = (key, max_items)
+		
+		with self.lock:
+			variants = self.feeds.get(feed_key)
+			
+			if variants is not None:
+				self.feeds.move_to_end(feed_key)
+		
+		if variants is None:
+			variants = {}
+			body = "".join(self.iter_feed(title, description, href, books_ids, max_items)).encode("utf-8")
+			
+			self.store_feed(feed_key, variants, None, body)
+		else:
+			body = variants[None]
+		
+		if encoding is None or len(body) < compression.MINIMUM_SIZE:
+			return (body, None)
+		
+		compressed = variants.get(encoding)
+		
+		if compressed is None:
+			compressed = compress(body, encoding)
+			
+			self.store_feed(feed_key, variants, encoding, compressed)
+		
+		return (compressed, encoding)
+	
+	def iter_feed(self, title, description, href, books_ids, max_items, chunk_items=limits.FEED_CHUNK_ITEMS):
+		"""
+		Retorna o feed com os livros mais recentes da lista em questão em partes,
+		com no máximo chunk_items itens cada.
+		"""
+		
+		books_ids = books_ids[-max_items:][::-1]
+		
+		yield RSS_ENTITY_HEADER.format(title, description, href)
+		
+		for index in range(0, len(books_ids), chunk_items):
+			yield "".join(
+				self.get_item(self.books.get(book_id))
+				for book_id in books_ids[index:index + chunk_items]
+			)
+		
+		yield RSS_ENTITY_FOOTER
+	
+	def count(self, max_items):
+		return min(max_items, len(self.offsets) - 1)
+	
+	def get(self, max_items, encoding=None):
+		"""
+		Retorna o feed já montado (e comprimido, quando possível) com a quantidade
+		de itens em questão, junto do algoritmo de compressão usado. Retorna None
+		quando essa quantidade de itens não foi montada com antecedência.
+		"""
+		
+		variants = self.bodies.get(max_items)
+		
+		if variants is None:
+			return None
+		
+		if encoding in variants:
+			return (variants[encoding], encoding)
+		
+		return (variants[None], None)
+	
+	def iter(self, max_items, chunk_items=limits.FEED_CHUNK_ITEMS):
+		"""
+		Retorna o feed com a quantidade de itens em questão em partes, com no
+		máximo chunk_items itens cada.
+		"""
+		
+		total_items = self.count(max_items)
+		
+		yield RSS_HEADER
+		
+		for index in range(0, total_items, chunk_items):
+			yield self.content[self.offsets[index]:self.offsets[min(index + chunk_items, total_items)]]
+		
+		yield RSS_FOOTER
+
+
+# Esta função é usada para gerar a resposta de um feed (OPDS ou RSS). Feeds grandes
+# são enviados aos poucos, sem que o documento completo seja mantido em memória;
+# os demais são enviados de uma única vez (e podem ser guardados no cache).
+def create_feed_response(content, total_items, media_type):
+	
+	if total_items > limits.STREAMING_FEED_ITEMS:
+		return StreamingResponse(content=content, media_type=media_type)
+	
+	return Response(content="".join(content), media_type=media_type)
@@ -0,0 +1,42 @@
+import urllib.parse
+
+from .books import format_date
+
+
+# Esta função retorna o nome do arquivo de um documento ou de uma capa, a partir
+# do título do livro relacionado a ele.
+def get_filename(media, book, default_name):
+	
+	if book is not None and book.title is not None:
+		return f"{book.title}.{media.file_extension}"
+	
+	return f"{default_name}.{media.file_extension}"
+
+
+# Esta função é usada para gerar os cabeçalhos das respostas dos endpoints de
+# download e visualização (ambos aceitam downloads parciais), usando apenas as
+# informações do acervo.
+def create_media_headers(media, book, disposition, default_name):
+	
+	return {
+		"Last-Modified": format_date(media.date),
+		"Content-Type": media.mime_type,
+		"Content-Length": str(media.file_size),
+		"Accept-Ranges": "bytes",
+		"Content-Disposition": '{}; filename="{}"'.format(
+			disposition, urllib.parse.quote(get_filename(media, book, default_name))),
+	}
+
+
+# Esta função é usada para gerar as informações (tamanho, tipo, data e nome do
+# arquivo) retornadas pelos endpoints de download e visualização com ?meta=1.
+def create_media_metadata(media, book, default_name):
+	
+	return {
+		"id": media.id,
+		"file_name": get_filename(media, book, default_name),
+		"file_size": media.file_size,
+		"mime_type": media.mime_type,
+		"date": media.date,
+		"last_modified": format_date(media.date)
+	}
@@ -0,0 +1,92 @@
+import contextvars
+
+from .compression import get_header
+from .serialization import FORMATS, JSON_FORMAT
+
+# Formato das respostas da requisição atual. É definido pelo middleware abaixo e
+# consultado pelos endpoints e pelas respostas JSON.
+response_format = contextvars.ContextVar("response_format", default=JSON_FORMAT)
+
+# Tipos de conteúdo aceitos para cada formato
+MEDIA_TYPES = {
+	"application/json": "json",
+	"application/msgpack": "msgpack",
+	"application/x-msgpack": "msgpack",
+	"application/vnd.msgpack": "msgpack",
+	"application/cbor": "cbor"
+}
+
+# Tipos de conteúdo das respostas geradas em cada formato
+RESPONSE_MEDIA_TYPES = {
+	media_type.encode("latin-1")
+	for format in FORMATS.values()
+	for media_type in (format.media_type, format.sequence_media_type)
+}
+
+
+# Esta função é usada para escolher o formato das respostas a partir do cabeçalho
+# Accept enviado pelo cliente. O JSON é usado caso nenhum dos outros formatos
+# tenha sido solicitado explicitamente.
+def negotiate_format(accept):
+	
+	if not accept:
+		return JSON_FORMAT
+	
+	best_format = JSON_FORMAT
+	best_quality = 0.0
+	
+	for item in accept.split(","):
+		(media_type, _, parameters) = item.strip().partition(";")
+		quality = 1.0
+		
+		for parameter in parameters.split(";"):
+			parameter = parameter.strip()
+			
+			if parameter.startswith("q="):
+				try:
+					quality = float(parameter[2:])
+				except ValueError:
+					quality = 0.0
+		
+		format = FORMATS.get(MEDIA_TYPES.get(media_type.strip().lower()))
+		
+		if format is not None and quality > best_quality:
+			best_format = format
+			best_quality = quality
+	
+	return best_format
+
+
+class FormatNegotiationMiddleware:
+	"""
+	Define o formato das respostas (JSON, MessagePack ou CBOR) a partir do cabeçalho
+	Accept e adiciona o cabeçalho Vary às respostas nesses formatos.
+	"""
+	
+	def __init__(self, app):
+		self.app = app
+	
+	async def __call__(self, scope, receive, send):
+		
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		
+		token = response_format.set(negotiate_format(get_header(scope, b"accept")))
+		
+		async def send_with_vary(message):
+			
+			if message["type"] == "http.response.start":
+				headers = message.get("headers", [])
+				
+				for (name, value) in headers:
+					if name.lower() == b"content-type" and value.split(b";")[0].strip() in RESPONSE_MEDIA_TYPES:
+						message["headers"] = list(headers) + [(b"vary", b"Accept")]
+						break
+			
+			await send(message)
+		
+		try:
+			await self.app(scope, receive, send_with_vary)
+		finally:
+			response_format.reset(token)
@@ -0,0 +1,156 @@
+import time
+
+from config.feeds import opds2
+
+from .serialization import Fragments, JSON_FORMAT
+
+
+# Esta função é usada para gerar um contribuidor (autor, artista, narrador ou
+# editora) de uma publicação, com o link para os livros relacionados a ele.
+def create_contributor(entity, path):
+	return {
+		"name": entity.name,
+		"links": [{"href": f"/opds2/{path}/{entity.id}", "type": opds2.MEDIA_TYPE}]
+	}
+
+
+# Esta função é usada para gerar a publicação (OPDS 2.0) de um livro.
+def create_opds2_publication(book, formatting):
+	
+	document = book.documents[0]
+	
+	metadata = {
+		"@type": "http://schema.org/Book",
+		"identifier": f"book:{book.id}",
+		"title": book.title if book.title is not None else "Unknown",
+		"modified": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(book.date)),
+		"language": "pt",
+		"description": formatting.get_caption(book)
+	}
+	
+	if book.author is not None:
+		metadata["author"] = create_contributor(book.author, "authors")
+	if book.artist is not None:
+		metadata["artist"] = create_contributor(book.artist, "artists")
+	if book.narrator is not None:
+		metadata["narrator"] = create_contributor(book.narrator, "narrators")
+	if book.publisher is not None:
+		metadata["publisher"] = create_contributor(book.publisher, "publishers")
+	if book.year is not None:
+		metadata["published"] = str(book.year.name)
+	if book.category is not None:
+		metadata["subject"] = [
+			{
+				"name": book.category.name,
+				"code": str(book.category.id),
+				"links": [{"href": f"/opds2/categories/{book.category.id}", "type": opds2.MEDIA_TYPE}]
+			}
+		]
+	
+	return {
+		"metadata": metadata,
+		"links": [
+			{
+				"rel": "http://opds-spec.org/acquisition/open-access",
+				"href": f"/download/{document.id}",
+				"type": document.mime_type
+			}
+		],
+		"images": [
+			{
+				"href": f"/view/{book.cover.id}",
+				"type": book.cover.mime_type,
+				"width": book.cover.resolution.width,
+				"height": book.cover.resolution.height
+			}
+		]
+	}
+
+
+# Esta função é usada para gerar as publicações de todos os livros, serializadas
+# uma única vez durante o carregamento do acervo.
+def create_opds2_publications(books, formatting):
+	
+	fragments = Fragments(())
+	
+	for book in books:
+		fragments.add(book.id, create_opds2_publication(book, formatting))
+	
+	return fragments
+
+
+# Esta função é usada para gerar os links de navegação para as entidades de uma
+# coleção (autores, categorias etc.), serializados uma única vez.
+def create_opds2_navigation(entities, path):
+	
+	fragments = Fragments(())
+	
+	for entity in entities:
+		fragments.add(
+			entity.id,
+			{
+				"href": f"/opds2/{path}/{entity.id}",
+				"title": entity.name,
+				"type": opds2.MEDIA_TYPE,
+				"rel": "subsection",
+				"properties": {"numberOfItems": entity.total_books}
+			}
+		)
+	
+	return fragments
+
+
+# Esta função é usada para gerar os links (página atual, próxima e anterior) de
+# uma página do feed. As demais páginas são obtidas através do cursor.
+def create_opds2_links(href, page, max_items):
+	
+	separator = "&" if "?" in href else "?"
+	
+	links = [
+		{
+			"rel": "self",
+			"href": f"{href}{separator}page_number={page['current_page']}&max_items={max_items}",
+			"type": opds2.MEDIA_TYPE
+		}
+	]
+	
+	if page["next_cursor"] is not None:
+		links.append({
+			"rel": "next",
+			"href": f"{href}{separator}cursor={page['next_cursor']}&max_items={max_items}",
+			"type": opds2.MEDIA_TYPE
+		})
+	
+	if page["previous_cursor"] is not None:
+		links.append({
+			"rel": "previous",
+			"href": f"{href}{separator}cursor={page['previous_cursor']}&max_items={max_items}",
+			"type": opds2.MEDIA_TYPE
+		})
+	
+	return links
+
+
+# Esta função é usada para montar uma página de um feed OPDS 2.0, com os itens
+# (navegação ou publicações) já serializados.
+def create_opds2_feed(title, links, collection, fragments, page, max_items):
+	
+	format = JSON_FORMAT
+	
+	metadata = {
+		"title": title,
+		"numberOfItems": page["total_results"],
+		"itemsPerPage": max_items,
+		"currentPage": page["current_page"] + 1
+	}
+	
+	return (
+		format.map_header(3)
+		+ format.pair("metadata", metadata) + format.separator
+		+ format.pair("links", links) + format.separator
+		+ format.dump(collection) + format.colon
+		+ format.array_header(len(page["ids"]))
+		+ fragments.join(page["ids"])
+		+ format.array_footer
+		+ format.map_footer
+	)
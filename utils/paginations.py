@@ -1,5 +1,186 @@
+import base64
+import bisect
+import json
+
+from .serialization import dump_json
+
+
 def create_pagination(items, max_values):
 	return [
 		items[i:i + max_values] for i in range(0, len(items), max_values)
 	]
 
+
+# Esta função é usada para gerar um cursor opaco, que guarda a versão do acervo,
+# a ordenação da listagem, a última identificação vista (e sua posição) e a
+# direção da navegação ("next" ou "previous").
+def encode_cursor(version, sort, object_id, position, direction):
+	
+	data = dump_json([version, sort, object_id, position, direction])
+	
+	return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+# Esta função é usada para ler um cursor gerado pela função acima. Retorna None
+# caso o cursor seja inválido.
+def decode_cursor(cursor):
+	
+	try:
+		data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+		(version, sort, object_id, position, direction) = json.loads(data)
+	except (TypeError, ValueError):
+		return None
+	
+	if (
+		not isinstance(object_id, int)
+		or not isinstance(position, int)
+		or direction not in ("next", "previous")
+	):
+		return None
+	
+	return {
+		"version": version,
+		"sort": sort,
+		"id": object_id,
+		"position": position,
+		"direction": direction
+	}
+
+
+# Esta função retorna a posição da identificação em questão na listagem. A posição
+# guardada no cursor (quando ele foi gerado para a versão atual do acervo) é
+# verificada primeiro; caso contrário, a identificação é procurada com busca
+# binária nas listagens ordenadas por identificação ("id" ou "-id") e com busca
+# linear nas demais (ex: livros de uma entidade, na ordem do acervo).
+def find_position(objects_ids, object_id, position, sort):
+	
+	if 0 <= position < len(objects_ids) and objects_ids[position] == object_id:
+		return (position, True)
+	
+	if sort not in ("id", "-id"):
+		try:
+			return (objects_ids.index(object_id), True)
+		except ValueError:
+			return (len(objects_ids), False)
+	
+	if sort == "-id":
+		(low, high) = (0, len(objects_ids))
+		
+		while low < high:
+			middle = (low + high) // 2
+			
+			if objects_ids[middle] > object_id:
+				low = middle + 1
+			else:
+				high = middle
+		
+		position = low
+	else:
+		position = bisect.bisect_left(objects_ids, object_id)
+	
+	found = position < len(objects_ids) and objects_ids[position] == object_id
+	
+	return (position, found)
+
+
+# Esta função é usada para selecionar os itens de uma página, a partir do número
+# da página ou de um cursor. Retorna None caso a página não exista ou o cursor
+# seja inválido.
+def paginate(objects_ids, page_number, max_items, cursor=None, version=None, sort="id"):
+	
+	total_results = len(objects_ids)
+	total_pages = -(-total_results // max_items)
+	
+	if cursor is not None:
+		cursor = decode_cursor(cursor)
+		
+		if cursor is None or cursor["sort"] != sort:
+			return None
+		
+		# A posição guardada em um cursor gerado para outra versão do acervo não é
+		# confiável; nesse caso, a identificação é procurada novamente.
+		position = cursor["position"] if cursor["version"] == version else -1
+		
+		(position, found) = find_position(objects_ids, cursor["id"], position, sort)
+		
+		if cursor["direction"] == "next":
+			start = position + 1 if found else position
+		else:
+			start = max(position - max_items, 0)
+		
+		if start >= total_results:
+			return None
+		
+		page_number = -(-start // max_items)
+	else:
+		if page_number >= total_pages:
+			return None
+		
+		start = page_number * max_items
+	
+	end = min(start + max_items, total_results)
+	page_ids = objects_ids[start:end]
+	
+	next_cursor = None
+	previous_cursor = None
+	
+	if end < total_results:
+		next_cursor = encode_cursor(version, sort, objects_ids[end - 1], end - 1, "next")
+	
+	if start > 0:
+		previous_cursor = encode_cursor(version, sort, objects_ids[start], start, "previous")
+	
+	return {
+		"ids": page_ids,
+		"total_results": total_results,
+		"total_pages": total_pages,
+		"remaining_pages": max(total_pages - 1 - page_number, 0),
+		"previous_page": (page_number - 1) if (page_number - 1) > -1 else None,
+		"current_page": page_number,
+		"next_page":  (page_number + 1) if (page_number + 1) < total_pages else None,
+		"next_cursor": next_cursor,
+		"previous_cursor": previous_cursor
+	}
+
+
+# Esta função é usada para montar uma página de resultados a partir dos fragmentos
+# já serializados dos objetos, no mesmo formato deles (JSON, MessagePack ou CBOR).
+# Retorna None caso a página não exista.
+def create_page(fragments, objects_ids, page_number, max_items, cursor=None, version=None, sort="id"):
+	
+	page = paginate(
+		objects_ids, page_number, max_items, cursor=cursor, version=version, sort=sort)
+	
+	if page is None:
+		return None
+	
+	pagination = {
+		"total_pages": page["total_pages"],
+		"remaining_pages": page["remaining_pages"],
+		"previous_page": page["previous_page"],
+		"current_page": page["current_page"],
+		"next_page": page["next_page"],
+		"previous_cursor": page["previous_cursor"],
+		"next_cursor": page["next_cursor"]
+	}
+	
+	format = fragments.format
+	
+	results = (
+		format.map_header(4)
+		+ format.pair("total_results", page["total_results"]) + format.separator
+		+ format.pair("max_results", max_items) + format.separator
+		+ format.pair("display_results", len(page["ids"])) + format.separator
+		+ format.dump("items") + format.colon
+		+ format.array_header(len(page["ids"]))
+		+ fragments.join(page["ids"])
+		+ format.array_footer
+		+ format.map_footer
+	)
+	
+	return (
+		format.map_header(2)
+		+ format.pair("pagination", pagination) + format.separator
+		+ format.dump("results") + format.colon + results
+		+ format.map_footer
+	)
@@ -0,0 +1,115 @@
+import re
+
+from .conditional import parse_http_date
+
+
+# Intervalo em bytes (ex: "0-499", "500-" ou "-500")
+RANGE_PATTERN = re.compile(r"([0-9]*)-([0-9]*)")
+
+
+# Esta função interpreta o cabeçalho Range de uma requisição. Retorna uma tupla
+# (início, fim) para intervalos válidos, None quando o conteúdo completo deve ser
+# enviado (inclusive quando o cabeçalho é inválido, como em "bytes=5-3") e False
+# quando o intervalo solicitado não pode ser atendido (ex: começa depois do fim
+# do conteúdo).
+def parse_range(range_header, size):
+	
+	if not range_header:
+		return None
+	
+	(unit, _, ranges) = range_header.partition("=")
+	
+	# Apenas um intervalo em bytes é suportado. Nos demais casos, o conteúdo
+	# completo é enviado.
+	if unit.strip().lower() != "bytes" or "," in ranges:
+		return None
+	
+	match = RANGE_PATTERN.fullmatch(ranges.strip())
+	
+	if match is None or match.group() == "-":
+		return None
+	
+	(start, end) = match.groups()
+	
+	if not start:
+		length = int(end)
+		
+		if length == 0:
+			return False
+		
+		return (max(size - length, 0), size - 1)
+	
+	start = int(start)
+	
+	if end and int(end) < start:
+		return None
+	
+	if start >= size:
+		return False
+	
+	end = int(end) if end else size - 1
+	
+	return (start, min(end, size - 1))
+
+
+# Esta função verifica se o cabeçalho If-Range corresponde à versão atual do
+# conteúdo (ETag ou data de modificação).
+def if_range_matches(if_range, etag, last_modified):
+	
+	if not if_range:
+		return True
+	
+	if_range = if_range.strip()
+	
+	if if_range.startswith('"') or if_range.startswith("W/"):
+		return if_range == etag
+	
+	timestamp = parse_http_date(if_range)
+	
+	return timestamp is not None and timestamp == parse_http_date(last_modified)
+
+
+# Esta função é usada para ler um intervalo de um arquivo em partes.
+def iter_file(path, start, end, chunk_size=1024 * 1024):
+	
+	yield from iter_open_file(open(file=path, mode="rb"), start, end, chunk_size)
+
+
+# Esta função é usada para ler um intervalo de um arquivo já aberto em partes. O
+# arquivo é fechado ao final.
+def iter_open_file(file, start, end, chunk_size=1024 * 1024):
+	
+	with file:
+		file.seek(start)
+		remaining = end - start + 1
+		
+		while remaining > 0:
+			chunk = file.read(min(chunk_size, remaining))
+			
+			if not chunk:
+				break
+			
+			remaining -= len(chunk)
+			
+			yield chunk
+
+
+# Esta função é usada para enviar apenas um intervalo de um conteúdo recebido em
+# partes (ex: as partes de 1 MiB de um documento do Telegram), a partir da parte
+# que contém o início do intervalo. Os primeiros bytes (skip) dessa parte são
+# descartados, assim como tudo o que vier depois do fim do intervalo.
+async def slice_chunks(content, skip, length):
+	
+	async for chunk in content:
+		if skip >= len(chunk):
+			skip -= len(chunk)
+			continue
+		
+		chunk = chunk[skip:skip + length]
+		skip = 0
+		length -= len(chunk)
+		
+		yield chunk
+		
+		if length <= 0:
+			break
@@ -0,0 +1,31 @@
+from fastapi.responses import JSONResponse
+
+from .negotiation import response_format
+
+
+class FastJSONResponse(JSONResponse):
+	"""
+	Resposta JSON que usa o serializador mais rápido disponível (orjson, msgspec
+	ou json) e não depende do jsonable_encoder para os objetos do acervo.
+	
+	Conteúdo já serializado (bytes), como as páginas montadas a partir dos
+	fragmentos pré-serializados, é enviado sem modificações.
+	
+	Quando o cliente solicita MessagePack ou CBOR (cabeçalho Accept), o conteúdo
+	é serializado nesse formato; o conteúdo já serializado deve ter sido gerado
+	no mesmo formato.
+	"""
+	
+	def __init__(self, content, *args, **kwargs):
+		
+		self.format = response_format.get()
+		self.media_type = self.format.media_type
+		
+		super().__init__(content, *args, **kwargs)
+	
+	def render(self, content):
+		
+		if isinstance(content, bytes):
+			return content
+		
+		return self.format.dump(content)
@@ -0,0 +1,47 @@
+import collections
+import threading
+
+
+class Searches:
+	"""
+	Resultados (identificações dos objetos, em ordem de relevância) das pesquisas
+	feitas recentemente, para que a paginação de uma pesquisa não precise refazê-la.
+	As pesquisas menos usadas recentemente são removidas primeiro.
+	"""
+	
+	def __init__(self, max_entries):
+		
+		self.max_entries = max_entries
+		
+		self.entries = collections.OrderedDict()
+		self.lock = threading.Lock()
+	
+	def get(self, name, collection, query, search_type):
+		"""
+		Retorna os resultados da pesquisa em questão na coleção (livros, autores etc.)
+		identificada por name.
+		"""
+		
+		key = (name, search_type, query)
+		
+		with self.lock:
+			objects_ids = self.entries.get(key)
+			
+			if objects_ids is not None:
+				self.entries.move_to_end(key)
+				return objects_ids
+		
+		if search_type == "fast":
+			results = collection.fast_search(query)
+		else:
+			results = collection.slow_search(query)
+		
+		objects_ids = [obj.id for obj in results] if results else []
+		
+		with self.lock:
+			self.entries[key] = objects_ids
+			
+			if len(self.entries) > self.max_entries:
+				self.entries.popitem(last=False)
+		
+		return objects_ids
@@ -0,0 +1,377 @@
+import array
+import collections
+import json
+import threading
+
+from fastapi.encoders import jsonable_encoder
+
+# Bibliotecas opcionais para serialização em JSON. A primeira disponível
+# (orjson, msgspec e por fim o módulo json) é usada.
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
+
+# Bibliotecas opcionais para os formatos binários (MessagePack e CBOR).
+try:
+	import msgpack
+except ImportError:
+	msgpack = None
+
+try:
+	import cbor2
+except ImportError:
+	cbor2 = None
+
+
+# Esta função é usada para converter objetos do acervo (livros, entidades etc.)
+# que não são suportados diretamente pelos serializadores.
+def encode_object(obj):
+	
+	try:
+		return dict(obj)
+	except (TypeError, ValueError):
+		raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+	JSON_BACKEND = "orjson"
+	
+	def dump_json(obj):
+		return orjson.dumps(
+			obj, default=encode_object, option=orjson.OPT_NON_STR_KEYS)
+elif msgspec is not None:
+	JSON_BACKEND = "msgspec"
+	
+	json_encoder = msgspec.json.Encoder(enc_hook=encode_object)
+	
+	def dump_json(obj):
+		return json_encoder.encode(obj)
+else:
+	JSON_BACKEND = "json"
+	
+	# O formato gerado é o mesmo do JSONResponse.
+	def dump_json(obj):
+		return json.dumps(
+			obj,
+			ensure_ascii=False,
+			allow_nan=False,
+			indent=None,
+			separators=(",", ":"),
+			default=encode_object
+		).encode("utf-8")
+
+
+# Esta função é usada para gerar o cabeçalho de um mapa ou de uma lista no formato
+# CBOR (tipo principal + tamanho).
+def create_cbor_header(major_type, length):
+	
+	major_type <<= 5
+	
+	if length < 24:
+		return bytes([major_type | length])
+	
+	if length < 0x100:
+		return bytes([major_type | 24]) + length.to_bytes(1, "big")
+	
+	if length < 0x10000:
+		return bytes([major_type | 25]) + length.to_bytes(2, "big")
+	
+	if length < 0x100000000:
+		return bytes([major_type | 26]) + length.to_bytes(4, "big")
+	
+	return bytes([major_type | 27]) + length.to_bytes(8, "big")
+
+
+class JSONFormat:
+	"""
+	Formato JSON. Os objetos são separados por vírgula e os mapas e listas são
+	delimitados por chaves e colchetes.
+	"""
+	
+	name = "json"
+	media_type = "application/json"
+	
+	# Exportações (um objeto por linha)
+	sequence_media_type = "application/x-ndjson"
+	sequence_separator = b"\n"
+	
+	separator = b","
+	colon = b":"
+	
+	map_footer = b"}"
+	array_footer = b"]"
+	
+	def dump(self, obj):
+		return dump_json(obj)
+	
+	def pair(self, key, value):
+		return dump_json(key) + b":" + dump_json(value)
+	
+	def map_header(self, length):
+		return b"{"
+	
+	def array_header(self, length):
+		return b"["
+
+
+class MessagePackFormat(JSONFormat):
+	"""
+	Formato MessagePack. Os mapas e listas possuem apenas um cabeçalho com a
+	quantidade de itens, seguido dos itens concatenados.
+	"""
+	
+	name = "msgpack"
+	media_type = "application/msgpack"
+	
+	sequence_media_type = "application/msgpack"
+	sequence_separator = b""
+	
+	separator = b""
+	colon = b""
+	
+	map_footer = b""
+	array_footer = b""
+	
+	def dump(self, obj):
+		return msgpack.packb(obj, default=encode_object, use_bin_type=True)
+	
+	def pair(self, key, value):
+		return self.dump(key) + self.dump(value)
+	
+	def map_header(self, length):
+		
+		if length < 16:
+			return bytes([0x80 | length])
+		
+		if length < 0x10000:
+			return b"\xde" + length.to_bytes(2, "big")
+		
+		return b"\xdf" + length.to_bytes(4, "big")
+	
+	def array_header(self, length):
+		
+		if length < 16:
+			return bytes([0x90 | length])
+		
+		if length < 0x10000:
+			return b"\xdc" + length.to_bytes(2, "big")
+		
+		return b"\xdd" + length.to_bytes(4, "big")
+
+
+class CBORFormat(MessagePackFormat):
+	"""
+	Formato CBOR. Assim como no MessagePack, os mapas e listas possuem apenas um
+	cabeçalho com a quantidade de itens.
+	"""
+	
+	name = "cbor"
+	media_type = "application/cbor"
+	
+	sequence_media_type = "application/cbor-seq"
+	
+	def dump(self, obj):
+		return cbor2.dumps(
+			obj, default=lambda encoder, value: encoder.encode(encode_object(value)))
+	
+	def map_header(self, length):
+		return create_cbor_header(5, length)
+	
+	def array_header(self, length):
+		return create_cbor_header(4, length)
+
+
+JSON_FORMAT = JSONFormat()
+
+# Formatos disponíveis para as respostas da API
+FORMATS = {JSON_FORMAT.name: JSON_FORMAT}
+
+if msgpack is not None:
+	FORMATS["msgpack"] = MessagePackFormat()
+
+if cbor2 is not None:
+	FORMATS["cbor"] = CBORFormat()
+
+
+class Fragments:
+	"""
+	Guarda a representação JSON de cada objeto de uma coleção (livros, documentos,
+	capas ou entidades), serializada uma única vez durante o carregamento do acervo.
+	
+	Também são guardadas as posições de cada campo dentro do JSON, o que permite
+	gerar projeções (apenas alguns campos de cada objeto) sem serializar novamente.
+	
+	As representações nos demais formatos (MessagePack e CBOR) são geradas a partir
+	do JSON apenas quando solicitadas pela primeira vez.
+	"""
+	
+	def __init__(self, objects, max_projections=32, format=JSON_FORMAT):
+		
+		self.format = format
+		
+		self.items = {}
+		self.offsets = {}
+		self.fields = {}
+		
+		self.projections = collections.OrderedDict()
+		self.max_projections = max_projections
+		self.lock = threading.Lock()
+		
+		self.variants = {}
+		self.variants_lock = threading.Lock()
+		
+		for obj in objects:
+			self.add(obj.id, jsonable_encoder(dict(obj)))
+	
+	def add(self, object_id, data):
+		
+		offsets = array.array("I", [0, 0]) * len(self.fields)
+		parts = []
+		
+		header = self.format.map_header(len(data))
+		position = len(header)
+		
+		for (key, value) in data.items():
+			index = self.fields.setdefault(key, len(self.fields))
+			
+			if index >= len(offsets) // 2:
+				offsets.extend([0, 0] * (index + 1 - len(offsets) // 2))
+			
+			part = self.format.pair(key, value)
+			
+			offsets[index * 2] = position
+			offsets[index * 2 + 1] = position + len(part)
+			
+			parts.append(part)
+			position += len(part) + len(self.format.separator)
+		
+		self.items[object_id] = (
+			header + self.format.separator.join(parts) + self.format.map_footer)
+		self.offsets[object_id] = offsets
+	
+	def variant(self, format):
+		"""
+		Retorna os fragmentos no formato em questão, gerando-os caso ainda não
+		existam.
+		"""
+		
+		if format is self.format:
+			return self
+		
+		with self.variants_lock:
+			fragments = self.variants.get(format.name)
+			
+			if fragments is None:
+				fragments = Fragments((), self.max_projections, format)
+				
+				for (object_id, item) in self.items.items():
+					fragments.add(object_id, json.loads(item))
+				
+				self.variants[format.name] = fragments
+		
+		return fragments
+	
+	def __contains__(self, object_id):
+		return object_id in self.items
+	
+	def get(self, object_id, format=None):
+		
+		if format is not None and format is not self.format:
+			return self.variant(format).get(object_id)
+		
+		return self.items.get(object_id)
+	
+	def join(self, objects_ids, separator=None):
+		
+		if separator is None:
+			separator = self.format.separator
+		
+		return separator.join(self.items[object_id] for object_id in objects_ids)
+	
+	def project(self, fields, format=None):
+		"""
+		Retorna a projeção com os campos informados (separados por vírgula), ou
+		None caso algum dos campos não exista. Sem campos, retorna todos eles.
+		"""
+		
+		if format is not None and format is not self.format:
+			return self.variant(format).project(fields)
+		
+		if not fields:
+			return self
+		
+		try:
+			indexes = tuple(
+				sorted({self.fields[field.strip()] for field in fields.split(",")})
+			)
+		except KeyError:
+			return None
+		
+		with self.lock:
+			projection = self.projections.get(indexes)
+			
+			if projection is None:
+				projection = Projection(self, indexes)
+				self.projections[indexes] = projection
+				
+				if len(self.projections) > self.max_projections:
+					self.projections.popitem(last=False)
+			else:
+				self.projections.move_to_end(indexes)
+		
+		return projection
+
+
+class Projection:
+	"""
+	Projeção de uma coleção de fragmentos. O conteúdo de cada objeto é montado a
+	partir dos trechos correspondentes aos campos selecionados sempre que ele é
+	solicitado (apenas fatias do conteúdo já serializado), de modo que a projeção
+	não ocupa memória além dos próprios fragmentos.
+	"""
+	
+	def __init__(self, fragments, indexes):
+		
+		self.fragments = fragments
+		self.format = fragments.format
+		self.indexes = indexes
+	
+	def __contains__(self, object_id):
+		return object_id in self.fragments
+	
+	def render(self, object_id):
+		
+		data = self.fragments.items[object_id]
+		offsets = self.fragments.offsets[object_id]
+		
+		parts = [
+			data[offsets[index * 2]:offsets[index * 2 + 1]]
+			for index in self.indexes
+			if index * 2 < len(offsets) and offsets[index * 2] != offsets[index * 2 + 1]
+		]
+		
+		return (
+			self.format.map_header(len(parts))
+			+ self.format.separator.join(parts)
+			+ self.format.map_footer
+		)
+	
+	def get(self, object_id):
+		
+		if object_id not in self.fragments:
+			return None
+		
+		return self.render(object_id)
+	
+	def join(self, objects_ids, separator=None):
+		
+		if separator is None:
+			separator = self.format.separator
+		
+		return separator.join(self.render(object_id) for object_id in objects_ids)